@@ -88,6 +88,7 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",  # Must be at top
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # Serve static files
+    "glossary.middleware.SPAStaticFileMiddleware",  # 404 for missing assets instead of index.html
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -175,6 +176,14 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# The TEST_MODE database is reset with known test passwords on every end-to-end run, so hash them with
+# the fast MD5 hasher there; PBKDF2 stays available to check passwords hashed before the switch
+if os.getenv("TEST_MODE") == "true":
+    PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    ]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -248,6 +257,8 @@ OKTA_ISSUER_URI = os.getenv("OKTA_ISSUER_URI", "")
 OKTA_REDIRECT_URI = os.getenv("OKTA_REDIRECT_URI", "http://localhost:4200/callback")
 
 # drf-spectacular Settings
+# Serve the schema, Swagger UI and ReDoc under /api/ (always on when DEBUG is set)
+ENABLE_API_DOCS = os.getenv("ENABLE_API_DOCS", "True").lower() == "true"
 SPECTACULAR_SETTINGS = {
     "TITLE": "Termageddon API",
     "DESCRIPTION": "API for managing glossary terms, entries, and drafts with approval workflow",
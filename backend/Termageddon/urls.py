@@ -15,19 +15,15 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from functools import update_wrapper
 
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path, re_path
+from django.utils.module_loading import import_string
 from django.views.generic import TemplateView
 
-from glossary.admin import csv_upload_view
 from glossary.views import health_check_view
 
 # Configure admin site URL for "VIEW SITE" link
@@ -38,24 +34,61 @@ else:
     # In production, frontend is served from same domain as backend
     admin.site.site_url = None  # None means use same domain as admin
 
+
+def lazy_view(dotted_path, csrf_exempt=False, **initkwargs):
+    """Import a class-based view on its first request instead of when the URLconf loads
+
+    CsrfViewMiddleware reads csrf_exempt before the view runs, so a view that as_view() exempts
+    (every DRF APIView) must be declared with csrf_exempt=True for its first request to be exempt too.
+    """
+    view = None
+
+    def dispatch(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(dotted_path).as_view(**initkwargs)
+            # Carry over what as_view() sets on the view (csrf_exempt, view_class, cls, initkwargs, ...)
+            update_wrapper(dispatch, view)
+        return view(request, *args, **kwargs)
+
+    if csrf_exempt:
+        dispatch.csrf_exempt = True
+    return dispatch
+
+
+# Everything under api/ is grouped so the resolver tests the prefix once
+api_urlpatterns = []
+
+if settings.DEBUG or settings.ENABLE_API_DOCS:
+    # API Documentation (drf_spectacular.views is only imported when first requested)
+    api_urlpatterns += [
+        path("schema/", lazy_view("drf_spectacular.views.SpectacularAPIView", csrf_exempt=True), name="schema"),
+        path(
+            "docs/",
+            lazy_view("drf_spectacular.views.SpectacularSwaggerView", csrf_exempt=True, url_name="schema"),
+            name="swagger-ui",
+        ),
+        path(
+            "redoc/",
+            lazy_view("drf_spectacular.views.SpectacularRedocView", csrf_exempt=True, url_name="schema"),
+            name="redoc",
+        ),
+    ]
+
+api_urlpatterns += [
+    path("", include("glossary.urls")),
+]
+
 urlpatterns = [
-    path("admin/glossary/upload-csv/", csv_upload_view, name="glossary_upload_csv"),
+    path("api/", include(api_urlpatterns)),
     path("admin/", admin.site.urls),
     path("health/", health_check_view, name="health-check"),
-    path("api/", include("glossary.urls")),
-    # API Documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path(
-        "api/docs/",
-        SpectacularSwaggerView.as_view(url_name="schema"),
-        name="swagger-ui",
-    ),
-    path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
     # Serve Angular frontend - catch-all route (must be last)
-    # Excludes: admin, api, health, static files, and common file extensions
+    # Excludes: admin, api, health, static. Common file extensions are rejected
+    # by SPAStaticFileMiddleware before URL resolution. The pattern is only a
+    # lookahead on the first characters, so matching never scans the rest of the path.
     re_path(
-        r"^(?!admin|api|health|static|favicon\.ico|"
-        r".*\.(ico|png|jpg|jpeg|gif|svg|css|js|woff|woff2|ttf|eot|json|xml|txt|pdf|zip|tar|gz)$).*$",
+        r"^(?!admin|api|health|static)",
         TemplateView.as_view(template_name="index.html"),
         name="frontend",
     ),
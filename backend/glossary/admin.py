@@ -1,16 +1,27 @@
-from django.contrib import admin
+import codecs
+import csv
+from itertools import chain
+
+from django.contrib import admin, messages
 from django.contrib.admin.views.decorators import staff_member_required
-from django.db import models
-from django.http import HttpResponseRedirect
-from django.shortcuts import render
-from django.urls import reverse
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db import IntegrityError, models, transaction
+from django.db.models import OuterRef, Q, Subquery, UniqueConstraint
+from django.db.models.functions import Substr
+from django.forms.models import BaseInlineFormSet
+from django.http import HttpResponseRedirect, StreamingHttpResponse
+from django.shortcuts import redirect, render
+from django.urls import path, reverse
+from django.utils import timezone
 from django.utils.html import format_html
-from django.views.decorators.csrf import csrf_protect
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
 
 from glossary.models import (
     Comment,
     Entry,
     EntryDraft,
+    EntryDraftApprover,
+    EntryDraftRequestedReviewer,
     Notification,
     Perspective,
     PerspectiveCurator,
@@ -18,24 +29,102 @@ from glossary.models import (
     Term,
     UserProfile,
 )
+from glossary.signals import create_draft_approved_notifications, update_approval_counts
 from glossary.utils import load_entries_from_csv
 
+# Number of characters shown for long text columns in changelists
+SHORT_TEXT_LENGTH = 50
+
+# Bytes read from the start of an upload to check it is a CSV file
+CSV_SNIFF_BYTES = 4096
+
+# Most recent drafts shown inline on the Entry change page
+RECENT_DRAFTS_INLINE_LIMIT = 20
+
+
+def _text_preview(field_name):
+    """Truncate a text column in SQL, keeping one extra character to detect overflow"""
+    return Substr(field_name, 1, SHORT_TEXT_LENGTH + 1)
+
+
+def _truncate(text):
+    """Shorten a _text_preview annotation for display, marking text that was cut off"""
+    if len(text) > SHORT_TEXT_LENGTH:
+        return text[:SHORT_TEXT_LENGTH] + "..."
+    return text
+
 
 # Custom actions
+#
+# Bulk actions should issue one UPDATE and report the row count it returns, rather than
+# iterating the queryset or running a separate count() query.
 def soft_delete_selected(modeladmin, request, queryset):
-    """Soft delete selected objects"""
-    for obj in queryset:
-        obj.delete()  # Uses soft delete from AuditedModel
-    modeladmin.message_user(request, f"Soft deleted {queryset.count()} items.")
+    """Soft delete selected objects with a single UPDATE
+
+    Sets is_deleted and updated_at as AuditedModel.delete() does, and also records the acting
+    user in updated_by, which delete() leaves unchanged.
+    """
+    count = queryset.update(is_deleted=True, updated_at=timezone.now(), updated_by=request.user)
+    modeladmin.message_user(request, f"Soft deleted {count} items.")
 
 
 setattr(soft_delete_selected, "short_description", "Soft delete selected items")
 
 
+def _live_unique_fields(model):
+    """Field tuples the model keeps unique among non-deleted rows (its partial UniqueConstraints)"""
+    return [
+        constraint.fields
+        for constraint in model._meta.constraints
+        if isinstance(constraint, UniqueConstraint) and constraint.condition == Q(is_deleted=False)
+    ]
+
+
+def _restorable_pks(model, rows):
+    """Primary keys of the deleted rows that can go live without breaking a live-row unique constraint
+
+    A row is kept back when a live row, or a row restored earlier in the same batch, already
+    holds its key.
+    """
+    blocked = set()
+    for fields in _live_unique_fields(model):
+        taken = set(model.objects.filter(**{f"{fields[0]}__in": {row[fields[0]] for row in rows}}).values_list(*fields))
+        for row in rows:
+            key = tuple(row[field] for field in fields)
+            if row["pk"] in blocked:
+                continue
+            if key in taken:
+                blocked.add(row["pk"])
+            else:
+                taken.add(key)
+    return [row["pk"] for row in rows if row["pk"] not in blocked]
+
+
 def undelete_selected(modeladmin, request, queryset):
-    """Undelete selected objects"""
-    count = queryset.update(is_deleted=False)
+    """Undelete selected objects, skipping any that would duplicate a live object"""
+    model = queryset.model
+    fields = {field for fields in _live_unique_fields(model) for field in fields}
+    rows = list(queryset.filter(is_deleted=True).order_by("pk").values("pk", *fields))
+    restorable = _restorable_pks(model, rows)
+
+    try:
+        with transaction.atomic():
+            count = model.all_objects.filter(pk__in=restorable).update(is_deleted=False)
+    except IntegrityError:
+        # A conflicting row went live between the check and the update
+        modeladmin.message_user(
+            request, "Nothing was restored: a live item with the same values already exists.", messages.ERROR
+        )
+        return
+
     modeladmin.message_user(request, f"Restored {count} items.")
+    skipped = len(rows) - len(restorable)
+    if skipped:
+        modeladmin.message_user(
+            request,
+            f"Skipped {skipped} items because a live item with the same values already exists.",
+            messages.WARNING,
+        )
 
 
 setattr(undelete_selected, "short_description", "Undelete selected items")
@@ -50,16 +139,76 @@ def mark_official_selected(modeladmin, request, queryset):
 setattr(mark_official_selected, "short_description", "Mark as official")
 
 
+class _Echo:
+    """Pseudo-buffer whose write() returns the value, so csv.writer rows can be streamed"""
+
+    def write(self, value):
+        return value
+
+
+ENTRY_EXPORT_COLUMNS = (
+    ("term", "term__text"),
+    ("perspective", "perspective__name"),
+    ("is_official", "is_official"),
+    ("created_at", "created_at"),
+)
+
+
+def export_csv_selected(modeladmin, request, queryset):
+    """Stream selected entries as CSV without building the file in memory"""
+    writer = csv.writer(_Echo())
+    header = [column for column, _ in ENTRY_EXPORT_COLUMNS]
+    rows = queryset.values_list(*(field for _, field in ENTRY_EXPORT_COLUMNS)).iterator(chunk_size=2000)
+
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in chain([header], rows)),
+        content_type="text/csv",
+    )
+    response["Content-Disposition"] = 'attachment; filename="entries.csv"'
+    return response
+
+
+setattr(export_csv_selected, "short_description", "Export selected entries to CSV")
+
+
 def bulk_approve_drafts(modeladmin, request, queryset):
-    """Approve selected entry drafts with current user"""
-    count = 0
-    for draft in queryset:
-        try:
-            draft.approve(request.user)
-            count += 1
-        except Exception as e:
-            modeladmin.message_user(request, f"Could not approve draft {draft.id}: {e}", level="ERROR")
-    modeladmin.message_user(request, f"Approved {count} drafts.")
+    """Approve selected entry drafts with current user
+
+    Applies the same rules as EntryDraft.approve(), but writes all approvals with one
+    bulk INSERT instead of per-draft add() calls.
+    """
+    user = request.user
+    # The per-draft checks and through rows only need the primary key
+    user_id = user.pk
+    drafts = list(queryset.select_related("entry__term").defer("content"))
+    already_approved = set(
+        EntryDraftApprover.objects.filter(entrydraft__in=drafts, user_id=user_id).values_list(
+            "entrydraft_id", flat=True
+        )
+    )
+
+    approvable = []
+    for draft in drafts:
+        if draft.author_id == user_id:
+            error = "Authors cannot approve their own drafts."
+        elif draft.pk in already_approved:
+            error = "You have already approved this draft."
+        else:
+            approvable.append(draft)
+            continue
+        modeladmin.message_user(request, f"Could not approve draft {draft.id}: {error}", level="ERROR")
+
+    with transaction.atomic():
+        EntryDraftApprover.objects.bulk_create(
+            [EntryDraftApprover(entrydraft_id=draft.pk, user_id=user_id) for draft in approvable],
+            batch_size=1000,
+        )
+        # Approving a draft fulfils any outstanding review request
+        EntryDraftRequestedReviewer.objects.filter(entrydraft__in=approvable, user_id=user_id).delete()
+        update_approval_counts(approvable)
+        create_draft_approved_notifications({draft: [user] for draft in approvable})
+
+    modeladmin.message_user(request, f"Approved {len(approvable)} drafts.")
 
 
 setattr(bulk_approve_drafts, "short_description", "Approve selected drafts")
@@ -69,16 +218,43 @@ def upload_csv_action(modeladmin, request, queryset):
     """Admin action to redirect to CSV upload form"""
     # This action doesn't require any items to be selected
     # Redirect to the CSV upload view regardless of queryset
-    return HttpResponseRedirect(reverse("glossary_upload_csv"))
+    return HttpResponseRedirect(_upload_url())
 
 
 setattr(upload_csv_action, "short_description", "Upload CSV file")
 
 
+class CachedChoicesInlineMixin:
+    """Evaluate foreign key <select> choices once per request instead of once per inline form"""
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        formfield = super().formfield_for_foreignkey(db_field, request, **kwargs)
+        if formfield is not None:
+            cache = request.__dict__.setdefault("_inline_choices_cache", {})
+            key = (self.model, db_field.name)
+            if key not in cache:
+                cache[key] = list(formfield.choices)
+            # Forms copy these choices rather than re-running the field's queryset
+            formfield.choices = cache[key]
+        return formfield
+
+
+class RecentDraftsInlineFormSet(BaseInlineFormSet):
+    """Limit the inline to the newest drafts; the inline queryset is filtered by entry before it can be sliced"""
+
+    def get_queryset(self):
+        if not hasattr(self, "_queryset"):
+            self._queryset = super().get_queryset()[:RECENT_DRAFTS_INLINE_LIMIT]
+        return self._queryset
+
+
 # Inline for EntryDraft under Entry
-class EntryDraftInline(admin.TabularInline):
+class EntryDraftInline(CachedChoicesInlineMixin, admin.TabularInline):
     model = EntryDraft
+    formset = RecentDraftsInlineFormSet
     extra = 0
+    max_num = RECENT_DRAFTS_INLINE_LIMIT
+    show_change_link = True
     fields = (
         "author",
         "content",
@@ -89,6 +265,10 @@ class EntryDraftInline(admin.TabularInline):
     readonly_fields = ("created_at", "approval_count_display", "is_approved")
     can_delete = False
 
+    def get_queryset(self, request):
+        # Each inline row renders str(draft), which walks entry, term, perspective and author
+        return super().get_queryset(request).select_related("entry__term", "entry__perspective", "author")
+
     def approval_count_display(self, obj):
         if obj.id:
             return f"{obj.approval_count} approvals"
@@ -104,8 +284,73 @@ class EntryDraftInline(admin.TabularInline):
     setattr(is_approved, "boolean", True)
 
 
+class SoftDeletedListFilter(admin.SimpleListFilter):
+    """is_deleted filter whose default (no parameter) is live rows only, with an explicit "All" choice"""
+
+    title = "is deleted"
+    parameter_name = "is_deleted__exact"
+
+    def lookups(self, request, model_admin):
+        return (("0", "No"), ("1", "Yes"), ("all", "All"))
+
+    def choices(self, changelist):
+        value = self.value() or "0"
+        for lookup, title in self.lookup_choices:
+            yield {
+                "selected": value == lookup,
+                "query_string": changelist.get_query_string({self.parameter_name: lookup}),
+                "display": title,
+            }
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value == "all":
+            return queryset
+        return queryset.filter(is_deleted=value == "1")
+
+
+class SoftDeleteModelAdmin(admin.ModelAdmin):
+    """ModelAdmin that can reach soft-deleted rows, listing live rows by default
+
+    The default manager excludes soft-deleted rows, so the admin reads through all_objects:
+    change, delete and history views open deleted objects, and the changelist narrows to live
+    rows through SoftDeletedListFilter. Autocomplete widgets only offer live rows.
+    """
+
+    # Large text columns the changelist never displays in full (list columns use SQL previews)
+    changelist_deferred_fields: tuple[str, ...] = ()
+
+    def get_list_filter(self, request):
+        list_filter = [SoftDeletedListFilter if f == "is_deleted" else f for f in super().get_list_filter(request)]
+        if SoftDeletedListFilter not in list_filter:
+            list_filter.append(SoftDeletedListFilter)
+        return list_filter
+
+    def get_queryset(self, request):
+        url_name = self._url_name(request)
+        if url_name == "autocomplete":
+            qs = super().get_queryset(request)
+        else:
+            qs = self.model.all_objects.get_queryset()
+            ordering = self.get_ordering(request)
+            if ordering:
+                qs = qs.order_by(*ordering)
+
+        if self.changelist_deferred_fields and url_name == self._changelist_url_name():
+            qs = qs.defer(*self.changelist_deferred_fields)
+        return qs
+
+    def _url_name(self, request):
+        match = request.resolver_match
+        return match.url_name if match is not None else None
+
+    def _changelist_url_name(self):
+        opts = self.model._meta
+        return f"{opts.app_label}_{opts.model_name}_changelist"
+
+
 # Inline for Comments on EntryDraft
-class CommentInline(admin.TabularInline):
+class CommentInline(CachedChoicesInlineMixin, admin.TabularInline):
     model = Comment
     extra = 0
     fields = ("author", "text", "is_resolved", "created_at")
@@ -114,7 +359,8 @@ class CommentInline(admin.TabularInline):
 
 
 @admin.register(Perspective)
-class PerspectiveAdmin(admin.ModelAdmin):
+class PerspectiveAdmin(SoftDeleteModelAdmin):
+    changelist_deferred_fields = ("description",)
     list_display = (
         "name",
         "description_short",
@@ -127,16 +373,17 @@ class PerspectiveAdmin(admin.ModelAdmin):
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
     actions = [soft_delete_selected, undelete_selected]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(description_preview=_text_preview("description"))
+
     def description_short(self, obj):
-        if len(obj.description) > 50:
-            return obj.description[:50] + "..."
-        return obj.description
+        return _truncate(obj.description_preview)
 
     setattr(description_short, "short_description", "Description")
 
 
 @admin.register(Term)
-class TermAdmin(admin.ModelAdmin):
+class TermAdmin(SoftDeleteModelAdmin):
     list_display = (
         "text",
         "text_normalized",
@@ -157,7 +404,7 @@ class TermAdmin(admin.ModelAdmin):
 
 
 @admin.register(Entry)
-class EntryAdmin(admin.ModelAdmin):
+class EntryAdmin(SoftDeleteModelAdmin):
     list_display = (
         "term",
         "perspective",
@@ -168,31 +415,61 @@ class EntryAdmin(admin.ModelAdmin):
     )
     list_filter = ("is_official", "is_deleted", "perspective", "created_at")
     search_fields = ("term__text", "perspective__name")
-    readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
+    list_select_related = ("term", "perspective")
+    readonly_fields = ("all_drafts_link", "created_at", "updated_at", "created_by", "updated_by")
     inlines = [EntryDraftInline]
     actions = [
         soft_delete_selected,
         undelete_selected,
         mark_official_selected,
+        export_csv_selected,
     ]
 
+    def get_urls(self):
+        """Register the CSV upload view under this admin's URL prefix"""
+        upload_urls = [
+            path(
+                "upload-csv/",
+                self.admin_site.admin_view(csv_upload_view),
+                name="glossary_entry_upload_csv",
+            ),
+        ]
+        return upload_urls + super().get_urls()
+
     def changelist_view(self, request, extra_context=None):
         """Add custom context for changelist view"""
         extra_context = extra_context or {}
         extra_context["show_csv_upload_link"] = request.user.is_superuser
         return super().changelist_view(request, extra_context=extra_context)
 
+    def get_queryset(self, request):
+        # Same ordering as Entry.get_latest_draft(), resolved in the changelist query
+        latest_draft = EntryDraft.objects.filter(entry=OuterRef("pk")).order_by("-created_at").values("pk")[:1]
+        return super().get_queryset(request).annotate(latest_draft_id=Subquery(latest_draft))
+
     def active_draft_display(self, obj):
-        draft = obj.get_latest_draft()
-        if draft:
-            return format_html('<span style="color: green;">draft{}</span>', draft.id)
+        if obj.latest_draft_id:
+            return format_html('<span style="color: green;">draft{}</span>', obj.latest_draft_id)
         return format_html('<span style="color: gray;">No drafts</span>')
 
     setattr(active_draft_display, "short_description", "Active Draft")
 
+    def all_drafts_link(self, obj):
+        if not obj.pk:
+            return "-"
+        url = f"{reverse('admin:glossary_entrydraft_changelist')}?entry__id__exact={obj.pk}"
+        return format_html(
+            '<a href="{}">View all drafts</a> (the inline below shows the {} most recent)',
+            url,
+            RECENT_DRAFTS_INLINE_LIMIT,
+        )
+
+    setattr(all_drafts_link, "short_description", "Drafts")
+
 
 @admin.register(EntryDraft)
-class EntryDraftAdmin(admin.ModelAdmin):
+class EntryDraftAdmin(SoftDeleteModelAdmin):
+    changelist_deferred_fields = ("content",)
     list_display = (
         "id",
         "entry",
@@ -204,6 +481,9 @@ class EntryDraftAdmin(admin.ModelAdmin):
     )
     list_filter = ("created_at", "is_deleted", "entry__perspective")
     search_fields = ("entry__term__text", "author__username", "content")
+    list_select_related = ("entry__term", "entry__perspective", "author")
+    # Search widgets instead of <select> lists holding every entry, user and draft
+    autocomplete_fields = ("entry", "author", "endorsed_by", "replaces_draft")
     readonly_fields = (
         "approval_count_display",
         "is_approved_display",
@@ -233,7 +513,8 @@ class EntryDraftAdmin(admin.ModelAdmin):
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(SoftDeleteModelAdmin):
+    changelist_deferred_fields = ("text", "draft__content")
     list_display = (
         "id",
         "author",
@@ -251,6 +532,14 @@ class CommentAdmin(admin.ModelAdmin):
         "draft__entry__perspective",
     )
     search_fields = ("text", "author__username", "draft__entry__term__text")
+    autocomplete_fields = ("draft", "parent", "author", "mentioned_users")
+    list_select_related = (
+        "author",
+        "draft__entry__term",
+        "draft__entry__perspective",
+        "draft__author",
+        "parent__author",
+    )
     readonly_fields = (
         "created_at",
         "updated_at",
@@ -260,46 +549,49 @@ class CommentAdmin(admin.ModelAdmin):
     )
     actions = [soft_delete_selected, undelete_selected]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(text_preview=_text_preview("text"))
+
     def text_short(self, obj):
-        if len(obj.text) > 50:
-            return obj.text[:50] + "..."
-        return obj.text
+        return _truncate(obj.text_preview)
 
     setattr(text_short, "short_description", "Text")
 
 
 @admin.register(PerspectiveCurator)
-class PerspectiveCuratorAdmin(admin.ModelAdmin):
+class PerspectiveCuratorAdmin(SoftDeleteModelAdmin):
     list_display = ("user", "perspective", "assigned_by", "is_deleted", "created_at")
     list_filter = ("is_deleted", "perspective", "created_at")
     search_fields = ("user__username", "perspective__name")
+    list_select_related = ("user", "perspective", "assigned_by")
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
     actions = [soft_delete_selected, undelete_selected]
 
 
 @admin.register(UserProfile)
-class UserProfileAdmin(admin.ModelAdmin):
+class UserProfileAdmin(SoftDeleteModelAdmin):
     list_display = ("user", "is_test_user", "is_deleted", "created_at")
     list_filter = ("is_test_user", "is_deleted", "created_at")
     search_fields = ("user__username", "user__first_name", "user__last_name")
+    list_select_related = ("user",)
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
     actions = [soft_delete_selected, undelete_selected]
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related("user")
-
 
 @admin.register(Reaction)
-class ReactionAdmin(admin.ModelAdmin):
+class ReactionAdmin(SoftDeleteModelAdmin):
+    changelist_deferred_fields = ("comment__text",)
     list_display = ("id", "comment", "user", "reaction_type", "created_at")
     list_filter = ("reaction_type", "created_at")
     search_fields = ("comment__text", "user__username")
+    list_select_related = ("comment__author", "user")
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
     actions = [soft_delete_selected, undelete_selected]
 
 
 @admin.register(Notification)
-class NotificationAdmin(admin.ModelAdmin):
+class NotificationAdmin(SoftDeleteModelAdmin):
+    changelist_deferred_fields = ("message",)
     list_display = (
         "id",
         "user",
@@ -310,29 +602,46 @@ class NotificationAdmin(admin.ModelAdmin):
     )
     list_filter = ("type", "is_read", "created_at")
     search_fields = ("user__username", "message")
+    list_select_related = ("user",)
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
     actions = [soft_delete_selected, undelete_selected]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(message_preview=_text_preview("message"))
+
     def message_short(self, obj):
-        if len(obj.message) > 50:
-            return obj.message[:50] + "..."
-        return obj.message
+        return _truncate(obj.message_preview)
 
     setattr(message_short, "short_description", "Message")
 
 
 # CSV Upload Admin View - Helper functions
+_UPLOAD_CONTEXT = {
+    "title": "Upload CSV",
+    "opts": Entry._meta,
+    "has_permission": True,
+}
+
+
 def _get_upload_context():
     """Get context for CSV upload template."""
     return {
-        "title": "Upload CSV",
-        "opts": Entry._meta,
-        "has_permission": True,
+        **_UPLOAD_CONTEXT,
         "site_header": admin.site.site_header,
         "site_title": admin.site.site_title,
     }
 
 
+def _changelist_url():
+    """URL of the Entry changelist."""
+    return reverse("admin:glossary_entry_changelist")
+
+
+def _upload_url():
+    """URL of the CSV upload view registered by EntryAdmin.get_urls()."""
+    return reverse("admin:glossary_entry_upload_csv")
+
+
 def _validate_csv_file(csv_file, request):
     """Validate uploaded CSV file. Returns (is_valid, error_message)."""
     if not csv_file:
@@ -348,19 +657,40 @@ def _validate_csv_file(csv_file, request):
             )
         return False, "Please select a CSV file to upload."
 
+    # The upload handler records the size while streaming, so this check does not read the file
     if csv_file.size > 10 * 1024 * 1024:
         return False, "File size exceeds 10MB limit. Please upload a smaller file."
 
     if not csv_file.name.endswith(".csv"):
         return False, "Please upload a CSV file (.csv extension)."
 
+    return _sniff_csv_header(csv_file)
+
+
+def _sniff_csv_header(csv_file):
+    """Check the first chunk of the upload looks like comma-separated UTF-8 text."""
+    head = csv_file.read(CSV_SNIFF_BYTES)
+    csv_file.seek(0)
+
+    if b"\x00" in head:
+        return False, "The uploaded file does not appear to be a text CSV file."
+
+    try:
+        # Incremental decode tolerates a multi-byte character split at the chunk boundary
+        text = codecs.getincrementaldecoder("utf-8")().decode(head)
+    except UnicodeDecodeError:
+        return False, "The uploaded file must be UTF-8 encoded."
+
+    try:
+        csv.Sniffer().sniff(text, delimiters=",")
+    except csv.Error:
+        return False, "The uploaded file does not appear to be comma-separated."
+
     return True, None
 
 
 def _handle_upload_success(summary, request):
     """Handle successful CSV upload with messages."""
-    from django.contrib import messages
-
     success_msg = (
         f"CSV uploaded successfully. "
         f"Entries created: {summary['entries_created']}, "
@@ -372,23 +702,29 @@ def _handle_upload_success(summary, request):
     success_msg += "."
     messages.success(request, success_msg)
 
-    if summary["errors"]:
-        for error in summary["errors"][:10]:
-            messages.warning(request, error)
-        if len(summary["errors"]) > 10:
-            messages.warning(request, f"... and {len(summary['errors']) - 10} more errors.")
+    for error in summary["errors"]:
+        messages.warning(request, error)
+    remaining_errors = summary["errors_total"] - len(summary["errors"])
+    if remaining_errors > 0:
+        messages.warning(request, f"... and {remaining_errors} more errors.")
 
 
 @staff_member_required
-@csrf_protect
+@csrf_exempt
 def csv_upload_view(request):
     """Custom admin view for CSV upload"""
-    if not request.user.is_superuser:
-        from django.contrib import messages
-        from django.shortcuts import redirect
+    # Stream uploads straight to a temporary file rather than buffering them in memory.
+    # Upload handlers must be replaced before request.POST is read, so the CSRF check
+    # happens in the inner view instead.
+    request.upload_handlers = [TemporaryFileUploadHandler(request)]
+    return _csv_upload_view(request)
 
+
+@csrf_protect
+def _csv_upload_view(request):
+    if not request.user.is_superuser:
         messages.error(request, "Only superusers can upload CSV files.")
-        return redirect("admin:glossary_entry_changelist")
+        return redirect(_changelist_url())
 
     if request.method == "POST":
         csv_file = request.FILES.get("csv_file")
@@ -396,18 +732,14 @@ def csv_upload_view(request):
 
         is_valid, error_msg = _validate_csv_file(csv_file, request)
         if not is_valid:
-            from django.contrib import messages
-
             messages.error(request, error_msg)
             return render(request, "admin/glossary/csv_upload.html", _get_upload_context())
 
         try:
             summary = load_entries_from_csv(csv_file, request.user, skip_duplicates=skip_duplicates)
             _handle_upload_success(summary, request)
-            return HttpResponseRedirect(reverse("admin:glossary_entry_changelist"))
+            return HttpResponseRedirect(_changelist_url())
         except Exception as e:
-            from django.contrib import messages
-
             messages.error(request, f"Error processing CSV: {str(e)}")
             return render(request, "admin/glossary/csv_upload.html", _get_upload_context())
 
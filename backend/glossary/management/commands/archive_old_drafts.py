@@ -1,6 +1,7 @@
 from datetime import timedelta
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 
 from glossary.models import EntryDraft
@@ -9,18 +10,38 @@ from glossary.models import EntryDraft
 class Command(BaseCommand):
     help = "Archive unpublished drafts older than 1 month"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of drafts archived per transaction (default: 5000)",
+        )
+
     def handle(self, *args, **options):
         """Archive unpublished drafts older than 1 month"""
         one_month_ago = timezone.now() - timedelta(days=30)
+        batch_size = options["batch_size"]
 
         # Find unpublished drafts older than 1 month that aren't already archived
+        # (served by the gl_ed_archivable_created_idx partial index)
         drafts_to_archive = EntryDraft.objects.filter(
             is_published=False,
             is_archived=False,
             created_at__lt=one_month_ago,
             is_deleted=False,
-        )
-
-        count = drafts_to_archive.update(is_archived=True)
+        ).order_by("created_at")
+
+        # Archive in batches so each transaction stays short and locks few rows. Rows another
+        # transaction holds (e.g. a draft open in the admin) are skipped and picked up on a later run.
+        count = 0
+        while True:
+            with transaction.atomic():
+                batch_ids = list(
+                    drafts_to_archive.select_for_update(skip_locked=True).values_list("pk", flat=True)[:batch_size]
+                )
+                if not batch_ids:
+                    break
+                count += EntryDraft.objects.filter(pk__in=batch_ids).update(is_archived=True)
 
         self.stdout.write(self.style.SUCCESS(f"Successfully archived {count} draft(s)"))
@@ -1,83 +1,93 @@
 import csv
+import heapq
 import random
 import re
+from collections import Counter, defaultdict
 from datetime import timedelta
 from pathlib import Path
 
+from unidecode import unidecode
+
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from django.core.management.base import BaseCommand
 from django.db import models, transaction
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
-from glossary.models import Entry, EntryDraft, Perspective, PerspectiveCurator, Term
-
-# Set random seed for reproducible test data
+from glossary.models import (
+    Entry,
+    EntryDraft,
+    EntryDraftApprover,
+    Perspective,
+    PerspectiveCurator,
+    Term,
+    UserProfile,
+)
+from glossary.signals import create_draft_approved_notifications, update_approval_counts
+
+# Seed for reproducible test data; each CSV row derives its own generator from it and the row index,
+# so a row's random choices do not depend on how many draws the rows before it made
 RANDOM_SEED = 42
-random.seed(RANDOM_SEED)
 
 
 class Command(BaseCommand):
     help = "Load test data from CSV file and create users, perspectives, entries"
 
-    def generate_realistic_timestamp(self, base_timestamp, is_published=False):
+    def generate_realistic_timestamp(self, rng, base_timestamp, is_published=False):
         """Generate a realistic timestamp within 6 months of base_timestamp"""
         # Published drafts should be older than unpublished ones
         if is_published:
             # Published drafts: 1-5 months ago
-            days_offset = random.randint(30, 150)
+            days_offset = rng.randint(30, 150)
             return base_timestamp - timedelta(days=days_offset)
         else:
             # Unpublished drafts: recent (0-20 days ago) so they're not archived
             # This ensures they show up in Review and My Drafts panels
-            days_offset = random.randint(0, 20)
+            days_offset = rng.randint(0, 20)
             return timezone.now() - timedelta(days=days_offset)
 
-    def select_approvers(self, perspective, author, all_users, num_approvers):
-        """Select approvers with preference for curators and domain-aligned users"""
-        # Get curators for this perspective
-        curators = PerspectiveCurator.objects.filter(perspective=perspective).values_list("user", flat=True)
-        curator_users = [u for u in all_users if u.id in curators and u != author]
-
-        # Get non-curator users (excluding author)
-        other_users = [u for u in all_users if u != author and u.id not in curators]
-
-        # Prefer curators: 70% chance to select from curators if available
-        if curator_users and random.random() < 0.7:
-            # Select from curators first, then fill remaining slots from others
-            selected_approvers = []
-            remaining_slots = num_approvers
-
-            # Add curators up to the number needed
-            if len(curator_users) >= remaining_slots:
-                selected_approvers = random.sample(curator_users, remaining_slots)
-            else:
-                selected_approvers = list(curator_users)
-                remaining_slots -= len(curator_users)
-
-                # Fill remaining slots from other users
-                if remaining_slots > 0 and other_users:
-                    additional_approvers = random.sample(other_users, min(remaining_slots, len(other_users)))
-                    selected_approvers.extend(additional_approvers)
-        else:
-            # Select randomly from all available users
-            available_users = [u for u in all_users if u != author]
-            selected_approvers = random.sample(available_users, min(num_approvers, len(available_users)))
-
-        return selected_approvers
-
-    def create_draft_revision_chain(self, entry, author, admin, base_timestamp, users, perspective):  # noqa: C901
-        """Create a chain of 2-3 draft revisions for an entry"""
-        num_revisions = random.randint(2, 3)
+    def get_approver_pools(self, curators, author, all_users):
+        """Build the weighted pool of users who may approve an author's draft
+
+        Returns (available_users, weights); the author is excluded and the perspective's curators are weighted
+        7:3 over everyone else.
+        """
+        curator_ids = {curator.id for curator in curators}
+        available_users = [u for u in all_users if u != author]
+        weights = [7 if u.id in curator_ids else 3 for u in available_users]
+        return available_users, weights
+
+    def select_approvers(self, rng, approver_pools, num_approvers):
+        """Select distinct approvers with preference for the perspective's curators
+
+        Uses weighted sampling without replacement: each user gets the key u ** (1 / weight) for a uniform u,
+        and the largest keys win.
+        """
+        available_users, weights = approver_pools
+        keyed = ((rng.random() ** (1 / weight), index) for index, weight in enumerate(weights))
+        return [available_users[index] for _, index in heapq.nlargest(num_approvers, keyed)]
+
+    def create_draft_revision_chain(
+        self, rng, entry, author, admin, base_timestamp, approver_pools, curators
+    ):  # noqa: C901
+        """Build a chain of 2-3 draft revisions for an entry, given the curators of its perspective
+
+        The drafts are returned unsaved, in chain order; each one replaces the draft before it.
+        Also returns a list of (draft, approvers) pairs for the caller to insert in bulk.
+        """
+        num_revisions = rng.randint(2, 3)
         drafts = []
+        approvals = []
 
         # Start with a recent timestamp (0-20 days ago) for unpublished drafts
         # This ensures they show up in Review and My Drafts panels
-        current_timestamp = timezone.now() - timedelta(days=random.randint(0, 20))
+        current_timestamp = timezone.now() - timedelta(days=rng.randint(0, 20))
 
         for i in range(num_revisions):
             # Each revision gets progressively newer created_at (sequential, not random)
             # Add 1-7 days between each revision to make the sequence clear
-            days_between = random.randint(1, 7)
+            days_between = rng.randint(1, 7)
             revision_timestamp = current_timestamp + timedelta(days=days_between * i)
 
             # Create draft with revision content
@@ -87,60 +97,43 @@ class Command(BaseCommand):
                 f"<p>Final definition for {entry.term.text} incorporating feedback</p>",
             ]
 
-            draft = EntryDraft.objects.create(
-                entry=entry,
-                content=(content_variations[i] if i < len(content_variations) else content_variations[-1]),
-                author=author,
-                created_by=admin,
+            drafts.append(
+                EntryDraft(
+                    entry=entry,
+                    content=(content_variations[i] if i < len(content_variations) else content_variations[-1]),
+                    author=author,
+                    created_by=admin,
+                    created_at=revision_timestamp,
+                )
             )
 
-            # Override auto_now_add created_at by updating directly
-            # This bypasses auto_now_add behavior
-            EntryDraft.objects.filter(pk=draft.pk).update(created_at=revision_timestamp)
-            draft.refresh_from_db()
-
-            # Link to previous draft if not the first
-            if i > 0:
-                draft.replaces_draft = drafts[i - 1]
-                draft.save()
-
-            drafts.append(draft)
-
         # Assign approval states to the chain
         # Published draft should be one of the earlier drafts (not the latest)
         # This ensures unpublished edits come after the published version
         published_draft_index = None
-        if random.random() < 0.6:  # 60% chance of having a published draft in the chain
+        if rng.random() < 0.6:  # 60% chance of having a published draft in the chain
             # Published draft should be in the first half of the chain
             # This ensures there are unpublished drafts after it
             max_published_index = max(0, len(drafts) - 2)  # At least one draft after published
-            published_draft_index = random.randint(0, max_published_index)
+            published_draft_index = rng.randint(0, max_published_index)
 
         # If we have a published draft, update timestamps so published is older
         # and unpublished drafts after it are newer
         if published_draft_index is not None:
             # Published draft gets older timestamp (1-5 months ago)
-            published_timestamp = base_timestamp - timedelta(days=random.randint(30, 150))
-            # Update published draft timestamp
-            EntryDraft.objects.filter(pk=drafts[published_draft_index].pk).update(created_at=published_timestamp)
-            drafts[published_draft_index].refresh_from_db()
+            published_timestamp = base_timestamp - timedelta(days=rng.randint(30, 150))
+            drafts[published_draft_index].created_at = published_timestamp
 
             # Update all drafts before published to be older than published
             for i in range(published_draft_index):
-                older_timestamp = published_timestamp - timedelta(days=random.randint(1, 30))
-                EntryDraft.objects.filter(pk=drafts[i].pk).update(created_at=older_timestamp)
-                drafts[i].refresh_from_db()
+                drafts[i].created_at = published_timestamp - timedelta(days=rng.randint(1, 30))
 
-            # Ensure all drafts after published are newer (they already are, but verify)
-            # The unpublished drafts already have recent timestamps, which is correct
-            # However, we need to ensure that any draft that replaces another has a newer timestamp
+            # Ensure every draft that replaces another has a newer timestamp
             # This is especially important after timestamp adjustments
-            for i, draft in enumerate(drafts):
-                if draft.replaces_draft and draft.created_at <= draft.replaces_draft.created_at:
+            for previous_draft, draft in zip(drafts, drafts[1:]):
+                if draft.created_at <= previous_draft.created_at:
                     # Ensure replacing draft is at least 1 second newer
-                    new_timestamp = draft.replaces_draft.created_at + timedelta(seconds=1)
-                    EntryDraft.objects.filter(pk=draft.pk).update(created_at=new_timestamp)
-                    draft.refresh_from_db()
+                    draft.created_at = previous_draft.created_at + timedelta(seconds=1)
 
         for i, draft in enumerate(drafts):
             if i == published_draft_index:
@@ -148,7 +141,7 @@ class Command(BaseCommand):
                 approval_state = "published"
             else:
                 # This draft will not be published
-                approval_state = random.choices(
+                approval_state = rng.choices(
                     ["no_approvals", "one_approval", "two_approvals"],
                     weights=[
                         30,
@@ -158,55 +151,50 @@ class Command(BaseCommand):
                 )[0]
 
             # Assign approvers based on state
-            all_users = list(users.values())
             if approval_state in ["one_approval", "two_approvals", "published"]:
                 num_approvers = 1 if approval_state == "one_approval" else 2
-                approvers = self.select_approvers(perspective, author, all_users, num_approvers)
-                draft.approvers.add(*approvers)
+                approvers = self.select_approvers(rng, approver_pools, num_approvers)
+                approvals.append((draft, approvers))
 
             # Mark as published if needed
             if approval_state == "published":
                 draft.is_published = True
                 draft.published_at = draft.created_at
-                draft.save()
 
                 # Add endorsement chance
-                if random.random() < 0.3:
-                    curators = PerspectiveCurator.objects.filter(perspective=perspective)
-                    if curators.exists():
-                        endorser = random.choice(curators).user
+                if rng.random() < 0.3:
+                    if curators:
+                        endorser = rng.choice(curators)
                         if endorser != author:
                             draft.endorsed_by = endorser
                             draft.endorsed_at = draft.created_at
-                            draft.save()
 
-        return drafts
+        return drafts, approvals
 
     def validate_data_consistency(self):
         """Validate logical consistency of generated data"""
         validation_errors = []
 
-        # Check published drafts have published_at timestamp
-        published_without_timestamp = EntryDraft.objects.filter(is_published=True, published_at__isnull=True).count()
-        if published_without_timestamp > 0:
+        # Published drafts need a published_at timestamp and at least 2 approvals, and authors must not
+        # approve their own drafts; all three are counted in a single pass over the drafts
+        own_approval = EntryDraftApprover.objects.filter(entrydraft=OuterRef("pk"), user=OuterRef("author"))
+        counts = EntryDraft.objects.annotate(has_own_approval=Exists(own_approval)).aggregate(
+            published_without_timestamp=models.Count(
+                "pk", filter=models.Q(is_published=True, published_at__isnull=True)
+            ),
+            published_without_approvals=models.Count("pk", filter=models.Q(is_published=True, approval_count__lt=2)),
+            self_approved=models.Count("pk", filter=models.Q(has_own_approval=True)),
+        )
+        if counts["published_without_timestamp"] > 0:
             validation_errors.append(
-                f"Found {published_without_timestamp} published drafts without published_at timestamp"
+                f"Found {counts['published_without_timestamp']} published drafts without published_at timestamp"
             )
-
-        # Check published drafts have at least 2 approvals
-        published_without_approvals = (
-            EntryDraft.objects.filter(is_published=True)
-            .annotate(approval_count=models.Count("approvers"))
-            .filter(approval_count__lt=2)
-            .count()
-        )
-        if published_without_approvals > 0:
-            validation_errors.append(f"Found {published_without_approvals} published drafts with less than 2 approvals")
-
-        # Check authors don't approve their own drafts
-        self_approved = EntryDraft.objects.filter(approvers=models.F("author")).count()
-        if self_approved > 0:
-            validation_errors.append(f"Found {self_approved} drafts where authors approved themselves")
+        if counts["published_without_approvals"] > 0:
+            validation_errors.append(
+                f"Found {counts['published_without_approvals']} published drafts with less than 2 approvals"
+            )
+        if counts["self_approved"] > 0:
+            validation_errors.append(f"Found {counts['self_approved']} drafts where authors approved themselves")
 
         # Check endorsed drafts have valid curator for that perspective
         # This is a complex check - for now, we'll skip it to avoid ORM complexity
@@ -215,14 +203,16 @@ class Command(BaseCommand):
             validation_errors.append(f"Found {invalid_endorsements} drafts endorsed by non-curators")
 
         # Check created_at consistency in revision chains
+        # The comparison runs in SQL, so only inconsistent drafts are loaded
         inconsistent_chains = 0
-        for draft in EntryDraft.objects.filter(replaces_draft__isnull=False).select_related("replaces_draft"):
-            if draft.created_at <= draft.replaces_draft.created_at:
-                inconsistent_chains += 1
-                # Fix the inconsistency by ensuring the replacing draft is newer
-                # Add a small buffer to ensure it's definitely newer
-                new_timestamp = draft.replaces_draft.created_at + timedelta(seconds=1)
-                EntryDraft.objects.filter(pk=draft.pk).update(created_at=new_timestamp)
+        for draft in EntryDraft.objects.filter(
+            replaces_draft__isnull=False, created_at__lte=models.F("replaces_draft__created_at")
+        ).select_related("replaces_draft"):
+            inconsistent_chains += 1
+            # Fix the inconsistency by ensuring the replacing draft is newer
+            # Add a small buffer to ensure it's definitely newer
+            new_timestamp = draft.replaces_draft.created_at + timedelta(seconds=1)
+            EntryDraft.objects.filter(pk=draft.pk).update(created_at=new_timestamp)
         if inconsistent_chains > 0:
             validation_errors.append(
                 f"Found {inconsistent_chains} revision chains with inconsistent created_at (fixed)"
@@ -234,56 +224,47 @@ class Command(BaseCommand):
         """Generate comprehensive data quality metrics"""
         metrics = {}
 
-        # Basic counts
-        metrics["total_drafts"] = EntryDraft.objects.count()
-        metrics["published_drafts"] = EntryDraft.objects.filter(is_published=True).count()
-        metrics["endorsed_drafts"] = EntryDraft.objects.filter(endorsed_by__isnull=False).count()
-        metrics["revision_chains"] = EntryDraft.objects.filter(replaces_draft__isnull=False).count()
-
-        # Approval distribution
-        approval_counts = {}
-        for i in range(4):  # 0-3 approvals
-            count = (
-                EntryDraft.objects.annotate(approval_count=models.Count("approvers")).filter(approval_count=i).count()
+        # Basic counts, plus the created_at range in the same query
+        metrics.update(
+            EntryDraft.objects.aggregate(
+                total_drafts=models.Count("pk"),
+                published_drafts=models.Count("pk", filter=models.Q(is_published=True)),
+                endorsed_drafts=models.Count("pk", filter=models.Q(endorsed_by__isnull=False)),
+                revision_chains=models.Count("pk", filter=models.Q(replaces_draft__isnull=False)),
+                oldest_created_at=models.Min("created_at"),
+                newest_created_at=models.Max("created_at"),
             )
-            approval_counts[f"{i}_approvals"] = count
-        metrics["approval_distribution"] = approval_counts
-
-        # Curator involvement - simplified check
-        # Count drafts where approvers are also perspective curators
-        curator_approvals = 0
-        for draft in EntryDraft.objects.prefetch_related("approvers", "entry__perspective"):
-            for approver in draft.approvers.all():
-                if PerspectiveCurator.objects.filter(user=approver, perspective=draft.entry.perspective).exists():
-                    curator_approvals += 1
-                    break  # Count each draft only once
-        metrics["curator_involvement"] = curator_approvals
-
-        # Created_at distribution
-        oldest_draft = EntryDraft.objects.order_by("created_at").first()
-        newest_draft = EntryDraft.objects.order_by("-created_at").first()
-        if oldest_draft and newest_draft:
-            metrics["timestamp_span_days"] = (newest_draft.created_at - oldest_draft.created_at).days
+        )
 
-        # Entry-level validation metrics
-        entries_with_only_unpublished = 0
-        entries_with_published = 0
-        entries_with_both_states = 0
+        # Approval distribution (0-3 approvals) from the drafts' stored approval counts
+        drafts_by_approval_count = Counter(EntryDraft.objects.values_list("approval_count", flat=True))
+        metrics["approval_distribution"] = {f"{i}_approvals": drafts_by_approval_count[i] for i in range(4)}
 
-        for entry in Entry.objects.all():
-            has_published = entry.drafts.filter(is_published=True).exists()
-            has_unpublished = entry.drafts.filter(is_published=False).exists()
+        # Curator involvement - count drafts approved by at least one curator of their perspective
+        curator_approval = PerspectiveCurator.objects.filter(
+            perspective=OuterRef("entry__perspective"),
+            user__approved_drafts=OuterRef("pk"),
+        )
+        metrics["curator_involvement"] = EntryDraft.objects.filter(Exists(curator_approval)).count()
 
-            if has_published and has_unpublished:
-                entries_with_both_states += 1
-            elif has_published:
-                entries_with_published += 1
-            elif has_unpublished:
-                entries_with_only_unpublished += 1
+        # Created_at distribution
+        oldest_created_at = metrics.pop("oldest_created_at")
+        newest_created_at = metrics.pop("newest_created_at")
+        if oldest_created_at and newest_created_at:
+            metrics["timestamp_span_days"] = (newest_created_at - oldest_created_at).days
 
-        metrics["entries_with_only_unpublished"] = entries_with_only_unpublished
-        metrics["entries_with_published"] = entries_with_published
-        metrics["entries_with_both_states"] = entries_with_both_states
+        # Entry-level validation metrics
+        published = EntryDraft.objects.filter(entry=OuterRef("pk"), is_published=True)
+        unpublished = EntryDraft.objects.filter(entry=OuterRef("pk"), is_published=False)
+        metrics.update(
+            Entry.objects.annotate(has_published=Exists(published), has_unpublished=Exists(unpublished)).aggregate(
+                entries_with_only_unpublished=models.Count(
+                    "pk", filter=models.Q(has_published=False, has_unpublished=True)
+                ),
+                entries_with_published=models.Count("pk", filter=models.Q(has_published=True, has_unpublished=False)),
+                entries_with_both_states=models.Count("pk", filter=models.Q(has_published=True, has_unpublished=True)),
+            )
+        )
 
         return metrics
 
@@ -308,6 +289,31 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS(f"Loading data from {csv_file}"))
 
+        # Work that needs no database happens before the transaction below opens, keeping it short.
+        # Read the CSV in one pass, collecting its authors and perspectives alongside
+        # (perspective, term, definition, author) tuples
+        unique_authors = set()
+        unique_perspectives = set()
+        rows = []
+        with open(csv_file, "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                unique_authors.add(row["author"])
+                unique_perspectives.add(row["perspective"])
+                rows.append((row["perspective"], row["term"], row["definition"], row["author"]))
+
+        # Shuffle rows to break alphabetical correlation with created_at
+        random.Random(RANDOM_SEED).shuffle(rows)
+
+        # Generate base timestamp (6 months ago)
+        base_timestamp = timezone.now() - timedelta(days=180)
+
+        is_real_data_mode = csv_path.endswith("real_data.csv")
+
+        # Hash the passwords up front as well, keeping the slow hasher out of the transaction
+        admin_password = make_password("admin")
+        # Shared password for test users, hashed once rather than once per user
+        test_user_password = make_password("ImABird")
+
         with transaction.atomic():
             # Create superuser (always reset password to ensure it works)
             admin, created = User.objects.get_or_create(
@@ -320,7 +326,7 @@ class Command(BaseCommand):
                 },
             )
             # Always reset password to ensure it's correct
-            admin.set_password("admin")
+            admin.password = admin_password
             admin.is_staff = True
             admin.is_superuser = True
             admin.save()
@@ -329,20 +335,6 @@ class Command(BaseCommand):
             else:
                 self.stdout.write(self.style.SUCCESS("Reset password for superuser: admin / admin"))
 
-            # Read CSV to extract unique authors
-            with open(csv_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                data = list(reader)
-
-            # Shuffle data to break alphabetical correlation with created_at
-            random.shuffle(data)
-
-            # Generate base timestamp (6 months ago)
-            base_timestamp = timezone.now() - timedelta(days=180)
-
-            unique_authors = set(row["author"] for row in data)
-            is_real_data_mode = csv_path.endswith("real_data.csv")
-
             # Create user accounts for authors
             users = {}
 
@@ -362,31 +354,54 @@ class Command(BaseCommand):
             # Convert to list to get the last user
             author_list = list(unique_authors)
 
-            for i, author_name in enumerate(author_list):
+            # Resolve every author's username first, so existing users are fetched in one query
+            # and the missing ones created in bulk
+            author_details = {}
+            for author_name in author_list:
                 if author_name in user_mappings:
-                    username, first_name, last_name = user_mappings[author_name]
+                    author_details[author_name] = user_mappings[author_name]
                 else:
                     # Fallback for any other authors
                     username = author_name.lower().replace(" ", "")
                     first_name, *last_parts = author_name.split()
                     last_name = " ".join(last_parts) if last_parts else ""
+                    author_details[author_name] = (username, first_name, last_name)
 
-                user, created = User.objects.get_or_create(
-                    username=username,
-                    defaults={
-                        "first_name": first_name,
-                        "last_name": last_name,
-                    },
-                )
-                # Always reset password to ensure it's correct
-                user.set_password("ImABird")  # Shared password for test users
+            users_by_username = User.objects.in_bulk(
+                {username for username, _, _ in author_details.values()}, field_name="username"
+            )
+            existing_usernames = set(users_by_username)
+            for author_name, (username, first_name, last_name) in author_details.items():
+                user = users_by_username.setdefault(username, User(username=username))
                 user.first_name = first_name
                 user.last_name = last_name
-                user.save()
+                # Always reset password to ensure it's correct
+                user.password = test_user_password
+                users[author_name] = user
+
+            new_users = [user for username, user in users_by_username.items() if username not in existing_usernames]
+            User.objects.bulk_create(new_users)
+            User.objects.bulk_update(
+                [users_by_username[username] for username in existing_usernames],
+                ["first_name", "last_name", "password"],
+            )
+
+            # bulk_create sends no post_save, so the profiles create_user_profile would have added are
+            # built here; all profiles are then written in bulk once the test user flags are set
+            profiles = {profile.user_id: profile for profile in UserProfile.objects.filter(user__in=users.values())}
+            new_profiles = []
+            for user in users_by_username.values():
+                if user.pk not in profiles:
+                    profiles[user.pk] = UserProfile(user=user)
+                    new_profiles.append(profiles[user.pk])
+
+            for i, author_name in enumerate(author_list):
+                user = users[author_name]
+                username = user.username
+                created = username not in existing_usernames
                 # Mark as test user (all but the last one)
                 is_test_user = i < len(author_list) - 1
-                user.profile.is_test_user = is_test_user
-                user.profile.save()
+                profiles[user.pk].is_test_user = is_test_user
 
                 if created:
                     if is_test_user:
@@ -398,10 +413,11 @@ class Command(BaseCommand):
                         self.stdout.write(self.style.SUCCESS(f"Reset password for test user: {username} / ImABird"))
                     else:
                         self.stdout.write(self.style.SUCCESS(f"Reset password for regular user: {username} / ImABird"))
-                users[author_name] = user
+
+            UserProfile.objects.bulk_update([profile for profile in profiles.values() if profile.pk], ["is_test_user"])
+            UserProfile.objects.bulk_create(new_profiles)
 
             # Create perspectives from CSV
-            unique_perspectives = set(row["perspective"] for row in data)
             perspectives = {}
 
             # Define specific descriptions for known perspectives
@@ -410,18 +426,21 @@ class Command(BaseCommand):
                 "Tools": "Software tools used by Verisk",
             }
 
-            for perspective_name in unique_perspectives:
+            # Fetch the existing perspectives in one query and insert the missing ones together
+            for perspective in Perspective.objects.filter(name__in=unique_perspectives):
+                perspectives.setdefault(perspective.name, perspective)
+            new_perspectives = []
+            for perspective_name in unique_perspectives - perspectives.keys():
                 description = perspective_descriptions.get(perspective_name, f"Terms related to {perspective_name}")
-                perspective, created = Perspective.objects.get_or_create(
+                perspectives[perspective_name] = Perspective(
                     name=perspective_name,
-                    defaults={
-                        "description": description,
-                        "created_by": admin,
-                    },
+                    name_normalized=unidecode(perspective_name.lower()),
+                    description=description,
+                    created_by=admin,
                 )
-                if created:
-                    self.stdout.write(self.style.SUCCESS(f"Created perspective: {perspective_name}"))
-                perspectives[perspective_name] = perspective
+                new_perspectives.append(perspectives[perspective_name])
+                self.stdout.write(self.style.SUCCESS(f"Created perspective: {perspective_name}"))
+            Perspective.objects.bulk_create(new_perspectives)
 
             # Assign specific users as perspective curators for realistic demo
             # Maria Flores - Physics, Chemistry curator
@@ -438,28 +457,64 @@ class Command(BaseCommand):
                 "Kenji Tanaka": ["Physics", "Geology"],
             }
 
-            for (
-                author_name,
-                perspective_names,
-            ) in perspective_curator_assignments.items():
+            # Fetch the existing assignments in one query and insert the missing ones together
+            assigned = set(PerspectiveCurator.objects.values_list("user_id", "perspective_id"))
+            new_curators = []
+            for author_name, perspective_names in perspective_curator_assignments.items():
                 if author_name in users:
                     user = users[author_name]
                     for perspective_name in perspective_names:
                         if perspective_name in perspectives:
-                            PerspectiveCurator.objects.get_or_create(
-                                user=user,
-                                perspective=perspectives[perspective_name],
-                                defaults={
-                                    "assigned_by": admin,
-                                    "created_by": admin,
-                                },
-                            )
+                            perspective = perspectives[perspective_name]
+                            if (user.pk, perspective.pk) not in assigned:
+                                assigned.add((user.pk, perspective.pk))
+                                new_curators.append(
+                                    PerspectiveCurator(
+                                        user=user, perspective=perspective, assigned_by=admin, created_by=admin
+                                    )
+                                )
                             self.stdout.write(
                                 self.style.SUCCESS(f"Assigned {author_name} as curator for {perspective_name}")
                             )
+            PerspectiveCurator.objects.bulk_create(new_curators)
+
+            # Curators per perspective, loaded once for approver and endorser selection
+            curators_by_perspective = defaultdict(list)
+            for curator in PerspectiveCurator.objects.select_related("user").order_by("pk"):
+                curators_by_perspective[curator.perspective_id].append(curator.user)
+
+            # Approver candidates, split per (perspective, author) on first use
+            all_users = list(users.values())
+            approver_pools_cache = {}
+
+            # Terms and entries for every CSV row, fetched and created in bulk rather than per row
+            term_texts = {term_text for _, term_text, _, _ in rows}
+            terms = {}
+            for term in Term.objects.filter(text__in=term_texts):
+                terms.setdefault(term.text, term)
+            new_terms = [
+                Term(text=text, text_normalized=unidecode(text.lower()), created_by=admin)
+                for text in term_texts - terms.keys()
+            ]
+            for term in Term.objects.bulk_create(new_terms, batch_size=1000):
+                terms[term.text] = term
+
+            entry_pairs = {
+                (terms[term_text], perspectives[perspective_name]) for perspective_name, term_text, _, _ in rows
+            }
+            entries = {}
+            for entry in Entry.objects.filter(term__in=terms.values()).select_related("term"):
+                entries.setdefault((entry.term_id, entry.perspective_id), entry)
+            new_entries = [
+                Entry(term=term, perspective=perspective, created_by=admin)
+                for term, perspective in entry_pairs
+                if (term.pk, perspective.pk) not in entries
+            ]
+            for entry in Entry.objects.bulk_create(new_entries, batch_size=1000):
+                entries[(entry.term_id, entry.perspective_id)] = entry
 
             # Load entries from CSV
-            entries_created = 0
+            entries_created = len(new_entries)
             drafts_created = 0
             revision_chains_created = 0
 
@@ -469,70 +524,97 @@ class Command(BaseCommand):
             # Track all entries for cross-reference resolution
             all_entries = {}  # (term_text, perspective_name) -> Entry
 
-            for row in data:
-                perspective = perspectives[row["perspective"]]
-                author = users[row["author"]]
-
-                # Get or create term
-                term, _ = Term.objects.get_or_create(text=row["term"], defaults={"created_by": admin})
-
-                # Get or create entry
-                entry, entry_created = Entry.objects.get_or_create(
-                    term=term,
-                    perspective=perspective,
-                    defaults={"created_by": admin},
-                )
-                if entry_created:
-                    entries_created += 1
+            # Drafts are built in memory and written in bulk after the loop
+            # Unsaved model instances are unhashable and cannot reference each other in bulk_create, so
+            # approvers and replaces_draft links are tracked alongside and applied once drafts have keys
+            pending_drafts = []  # Drafts to insert or update, in CSV order
+            pending_approvers = {}  # id(draft) -> (draft, approvers)
+            replaced_drafts = []  # (draft, draft it replaces)
+
+            # Newest unpublished draft per (entry, author), kept in step with the drafts built below
+            open_drafts = {}
+            for existing in EntryDraft.objects.filter(is_published=False).order_by("created_at"):
+                open_drafts[(existing.entry_id, existing.author_id)] = existing
+
+            for row_index, (perspective_name, term_text, definition, author_name) in enumerate(rows):
+                rng = random.Random(hash((RANDOM_SEED, row_index)))
+                perspective = perspectives[perspective_name]
+                curators = curators_by_perspective[perspective.pk]
+                author = users[author_name]
+                pools_key = (perspective.pk, author.pk)
+                if pools_key not in approver_pools_cache:
+                    approver_pools_cache[pools_key] = self.get_approver_pools(curators, author, all_users)
+                approver_pools = approver_pools_cache[pools_key]
+                potential_approvers = approver_pools[0]
+
+                term = terms[term_text]
+                entry = entries[(term.pk, perspective.pk)]
 
                 # Store entry for cross-reference resolution
-                entry_key = (row["term"], row["perspective"])
+                entry_key = (term_text, perspective_name)
                 all_entries[entry_key] = entry
 
                 # Prepare content - check if already has HTML tags
-                content = row["definition"].strip()
+                content = definition.strip()
                 if not content.startswith("<"):
                     # Wrap in paragraph if not already HTML
                     content = f"<p>{content}</p>"
 
                 # Check if this is a second draft for the same entry
-                entry_key = (row["term"], row["perspective"])
+                entry_key = (term_text, perspective_name)
                 previous_drafts = entry_drafts.get(entry_key, [])
 
                 # Check if this author already has an unpublished draft for this entry
-                existing_draft = EntryDraft.objects.filter(
-                    entry=entry, author=author, is_deleted=False, is_published=False
-                ).first()
+                existing_draft = open_drafts.get((entry.pk, author.pk))
 
                 # For real data mode: detect if this is a second draft (EES terms have 2 rows)
                 # If we already have a draft for this entry from this author, this is the second draft
                 is_second_draft = len(previous_drafts) > 0 and previous_drafts[-1].author == author
+                # Read before this row's draft is appended to the same list below
+                replaced_draft = previous_drafts[-1] if is_second_draft else None
 
                 # Decide whether to create revision chain (~15% chance for test data, not for real data)
                 create_revision_chain = (
-                    not is_real_data_mode and random.random() < 0.15 and not existing_draft and not is_second_draft
+                    not is_real_data_mode and rng.random() < 0.15 and not existing_draft and not is_second_draft
                 )
 
                 if create_revision_chain:
                     # Create revision chain (test data mode only)
-                    drafts = self.create_draft_revision_chain(entry, author, admin, base_timestamp, users, perspective)
+                    drafts, approvals = self.create_draft_revision_chain(
+                        rng, entry, author, admin, base_timestamp, approver_pools, curators
+                    )
+                    pending_drafts.extend(drafts)
+                    replaced_drafts.extend(zip(drafts[1:], drafts))
+                    for chain_draft, approvers in approvals:
+                        pending_approvers[id(chain_draft)] = (chain_draft, approvers)
                     drafts_created += len(drafts)
                     revision_chains_created += 1
                     entry_drafts[entry_key] = entry_drafts.get(entry_key, []) + drafts
+                    for chain_draft in drafts:
+                        if not chain_draft.is_published:
+                            open_drafts[(entry.pk, author.pk)] = chain_draft
                     continue  # Skip single draft creation
                 elif existing_draft and not is_second_draft:
                     # Update existing draft instead of creating new one
-                    existing_draft.content = content
-                    existing_draft.save()
                     draft = existing_draft
+                    if draft.pk:
+                        # Saving new content clears the approvals already stored for the draft
+                        draft.content = content
+                        draft.save()
+                    else:
+                        draft.content = content
+                    pending_approvers.pop(id(draft), None)
+                    if draft not in pending_drafts:
+                        pending_drafts.append(draft)
                 else:
                     # Create new entry draft
-                    draft = EntryDraft.objects.create(
+                    draft = EntryDraft(
                         entry=entry,
                         content=content,
                         author=author,
                         created_by=admin,
                     )
+                    pending_drafts.append(draft)
                 drafts_created += 1
 
                 # Track this draft
@@ -541,15 +623,10 @@ class Command(BaseCommand):
                 entry_drafts[entry_key].append(draft)
 
                 # Link to previous draft if this is a second draft
-                if is_second_draft and len(previous_drafts) > 0:
-                    previous_draft = previous_drafts[-1]
-                    draft.replaces_draft = previous_draft
-                    draft.save()
+                if replaced_draft is not None:
+                    replaced_drafts.append((draft, replaced_draft))
 
                 # Determine if this draft should be published
-                all_users = list(users.values())
-                potential_approvers = [u for u in all_users if u != author]
-
                 if is_real_data_mode:
                     # Real data mode: all terms start out published
                     # For EES terms: second (improved) draft is published, first draft is not
@@ -557,7 +634,7 @@ class Command(BaseCommand):
                     if is_second_draft:
                         # Second draft for EES terms - publish it
                         will_be_published = True
-                    elif row["perspective"] == "Tools":
+                    elif perspective_name == "Tools":
                         # Tools terms - publish the single draft
                         will_be_published = True
                     else:
@@ -565,7 +642,7 @@ class Command(BaseCommand):
                         will_be_published = False
                 else:
                     # Test data mode: determine approval state and publishing
-                    approval_state = random.choices(
+                    approval_state = rng.choices(
                         ["no_approvals", "one_approval", "two_approvals", "published"],
                         weights=[15, 20, 25, 40],
                     )[0]
@@ -577,170 +654,212 @@ class Command(BaseCommand):
                 now = timezone.now()
                 max_timestamp = now - timedelta(days=1)
 
-                if is_real_data_mode and is_second_draft and len(previous_drafts) > 0:
+                if is_real_data_mode and replaced_draft is not None:
                     # Second draft should be after the first draft
-                    # Get the first draft's timestamp from DB to ensure we have the updated value
-                    first_draft = previous_drafts[-1]
-                    first_draft.refresh_from_db()
-                    first_draft_timestamp = first_draft.created_at
+                    first_draft_timestamp = replaced_draft.created_at
                     # Generate timestamp 1-4 weeks after the first draft
-                    days_after_first = random.randint(7, 28)
+                    days_after_first = rng.randint(7, 28)
                     realistic_timestamp = first_draft_timestamp + timedelta(days=days_after_first)
                     # Cap to ensure it's not in the future
                     if realistic_timestamp > max_timestamp:
                         realistic_timestamp = max_timestamp
-                elif is_real_data_mode and not is_second_draft and row["perspective"] == "EES":
+                elif is_real_data_mode and not is_second_draft and perspective_name == "EES":
                     # First draft for EES terms: make it older (3-4 months ago)
-                    days_offset = random.randint(90, 120)
+                    days_offset = rng.randint(90, 120)
                     realistic_timestamp = now - timedelta(days=days_offset)
                 else:
-                    realistic_timestamp = self.generate_realistic_timestamp(base_timestamp, will_be_published)
+                    realistic_timestamp = self.generate_realistic_timestamp(rng, base_timestamp, will_be_published)
                     # Cap to ensure it's not in the future
                     if realistic_timestamp > max_timestamp:
                         realistic_timestamp = max_timestamp
 
-                # Update draft with created_at (bypass auto_now_add by using update)
-                EntryDraft.objects.filter(pk=draft.pk).update(created_at=realistic_timestamp)
-                draft.refresh_from_db()
+                # Written by the bulk_update below (bulk_create would apply auto_now_add)
+                draft.created_at = realistic_timestamp
 
                 if is_real_data_mode:
                     # Real data mode: just set published flag directly, no approval workflow
                     if will_be_published:
                         draft.is_published = True
                         draft.published_at = realistic_timestamp
-                        draft.save()
                 else:
                     # Test data mode: use approval workflow
                     if approval_state == "one_approval" and len(potential_approvers) >= 1:
-                        approvers = self.select_approvers(perspective, author, all_users, 1)
-                        draft.approvers.add(*approvers)
+                        approvers = self.select_approvers(rng, approver_pools, 1)
+                        pending_approvers[id(draft)] = (draft, approvers)
                     elif approval_state in ["two_approvals", "published"]:
                         # Need at least 2 approvers for published drafts
                         if len(potential_approvers) >= 2:
-                            approvers = self.select_approvers(perspective, author, all_users, 2)
-                            draft.approvers.add(*approvers)
+                            approvers = self.select_approvers(rng, approver_pools, 2)
+                            pending_approvers[id(draft)] = (draft, approvers)
 
                         # If published, mark as published and set published_at
                         if approval_state == "published":
                             draft.is_published = True
                             draft.published_at = realistic_timestamp
-                            draft.save()
 
                         # Add endorsements: ~30% of published drafts get endorsed by a curator
-                        if random.random() < 0.3:
-                            curators = PerspectiveCurator.objects.filter(perspective=perspective)
-                            if curators.exists():
-                                endorser = random.choice(curators).user
+                        if rng.random() < 0.3:
+                            if curators:
+                                endorser = rng.choice(curators)
                                 if endorser != author:  # Don't self-endorse
                                     draft.endorsed_by = endorser
                                     draft.endorsed_at = realistic_timestamp
-                                    draft.save()
+
+                if draft.is_published:
+                    open_drafts.pop((entry.pk, author.pk), None)
+                else:
+                    open_drafts[(entry.pk, author.pk)] = draft
+
+            # Insert the new drafts, then write the fields bulk_create cannot: the chosen created_at
+            # (auto_now_add overwrites it on insert) and links to drafts that had no primary key yet
+            timestamps = [draft.created_at for draft in pending_drafts]
+            EntryDraft.objects.bulk_create([draft for draft in pending_drafts if draft.pk is None], batch_size=1000)
+            for draft, timestamp in zip(pending_drafts, timestamps):
+                draft.created_at = timestamp
+            for draft, replaced_draft in replaced_drafts:
+                draft.replaces_draft = replaced_draft
+            EntryDraft.objects.bulk_update(
+                pending_drafts,
+                ["created_at", "replaces_draft", "is_published", "published_at", "endorsed_by", "endorsed_at"],
+                batch_size=1000,
+            )
+
+            # Insert the approvals through the join table in one go; bulk_create sends no m2m_changed,
+            # so the draft_approved notifications the signal would send are created explicitly
+            approvals = dict(pending_approvers.values())
+            stored_approvals = set(
+                EntryDraftApprover.objects.filter(entrydraft__in=approvals).values_list("entrydraft_id", "user_id")
+            )
+            EntryDraftApprover.objects.bulk_create(
+                [
+                    EntryDraftApprover(entrydraft=draft, user=user)
+                    for draft, approvers in approvals.items()
+                    for user in approvers
+                    if (draft.pk, user.pk) not in stored_approvals
+                ],
+                batch_size=1000,
+            )
+            update_approval_counts(approvals)
+            create_draft_approved_notifications(approvals)
 
             # Resolve cross-reference placeholders after all entries are created
             self.stdout.write(self.style.SUCCESS("Resolving cross-references..."))
             cross_ref_count = 0
-            for draft in EntryDraft.objects.all():
+            resolved_drafts = []
+            for draft in EntryDraft.objects.filter(content__contains="[["):
                 content = draft.content
-                if "[[" in content:
-                    # Find all cross-reference placeholders: [[Term|Perspective]]
-                    pattern = r"\[\[([^\|]+)\|([^\]]+)\]\]"
-                    matches = re.findall(pattern, content)
-
-                    for term_text, perspective_name in matches:
-                        # Look up entry
-                        entry_key = (term_text.strip(), perspective_name.strip())
-                        referenced_entry = all_entries.get(entry_key)
-
-                        if referenced_entry:
-                            # Replace placeholder with HTML link
-                            placeholder = f"[[{term_text}|{perspective_name}]]"
-                            link_text = f"{term_text} 📖"
-                            link_html = (
-                                f'<a href="/entry/{referenced_entry.id}" '
-                                f'data-entry-id="{referenced_entry.id}">'
-                                f"{link_text}</a>"
-                            )
-                            content = content.replace(placeholder, link_html)
-                            cross_ref_count += 1
-                        else:
-                            # Log warning for missing references
-                            self.stdout.write(
-                                self.style.WARNING(
-                                    f"  Warning: Could not resolve cross-reference "
-                                    f"[[{term_text}|{perspective_name}]] "
-                                    f"in draft {draft.id}"
-                                )
+                # Find all cross-reference placeholders: [[Term|Perspective]]
+                pattern = r"\[\[([^\|]+)\|([^\]]+)\]\]"
+                matches = re.findall(pattern, content)
+
+                for term_text, perspective_name in matches:
+                    # Look up entry
+                    entry_key = (term_text.strip(), perspective_name.strip())
+                    referenced_entry = all_entries.get(entry_key)
+
+                    if referenced_entry:
+                        # Replace placeholder with HTML link
+                        placeholder = f"[[{term_text}|{perspective_name}]]"
+                        link_text = f"{term_text} 📖"
+                        link_html = (
+                            f'<a href="/entry/{referenced_entry.id}" '
+                            f'data-entry-id="{referenced_entry.id}">'
+                            f"{link_text}</a>"
+                        )
+                        content = content.replace(placeholder, link_html)
+                        cross_ref_count += 1
+                    else:
+                        # Log warning for missing references
+                        self.stdout.write(
+                            self.style.WARNING(
+                                f"  Warning: Could not resolve cross-reference "
+                                f"[[{term_text}|{perspective_name}]] "
+                                f"in draft {draft.id}"
                             )
-
-                    # Update draft content if changed
-                    if content != draft.content:
-                        draft.content = content
-                        draft.save()
+                        )
+
+                # Update draft content if changed
+                if content != draft.content:
+                    draft.content = content
+                    draft.updated_at = timezone.now()
+                    resolved_drafts.append(draft)
+
+            # Write the rewritten content in one go, clearing approvals of the changed drafts as
+            # EntryDraft.save would; none of the draft signals act on these updates
+            EntryDraftApprover.objects.filter(entrydraft__in=resolved_drafts).delete()
+            for draft in resolved_drafts:
+                draft.approval_count = 0
+            EntryDraft.objects.bulk_update(
+                resolved_drafts, ["content", "updated_at", "approval_count"], batch_size=1000
+            )
 
             if cross_ref_count > 0:
                 self.stdout.write(self.style.SUCCESS(f"  Resolved {cross_ref_count} cross-references"))
 
+            # The summary below is collected and written in one go
+            report = []
+
             # Validate data consistency
             validation_errors = self.validate_data_consistency()
             if validation_errors:
-                self.stdout.write(self.style.ERROR("\nData validation errors found:"))
+                report.append(self.style.ERROR("\nData validation errors found:"))
                 for error in validation_errors:
-                    self.stdout.write(self.style.ERROR(f"  - {error}"))
+                    report.append(self.style.ERROR(f"  - {error}"))
             else:
-                self.stdout.write(self.style.SUCCESS("\nData validation passed - all checks successful!"))
+                report.append(self.style.SUCCESS("\nData validation passed - all checks successful!"))
 
             # Generate and display data quality metrics
             metrics = self.generate_data_quality_metrics()
 
-            self.stdout.write(self.style.SUCCESS("\nData loading complete!"))
-            self.stdout.write(self.style.SUCCESS(f"Created {len(users)} users"))
-            self.stdout.write(self.style.SUCCESS(f"Created {len(perspectives)} perspectives"))
-            self.stdout.write(self.style.SUCCESS(f"Created {entries_created} entries"))
-            self.stdout.write(self.style.SUCCESS(f"Created {drafts_created} entry drafts"))
-            self.stdout.write(self.style.SUCCESS(f"Created {revision_chains_created} revision chains"))
+            report.append(self.style.SUCCESS("\nData loading complete!"))
+            report.append(self.style.SUCCESS(f"Created {len(users)} users"))
+            report.append(self.style.SUCCESS(f"Created {len(perspectives)} perspectives"))
+            report.append(self.style.SUCCESS(f"Created {entries_created} entries"))
+            report.append(self.style.SUCCESS(f"Created {drafts_created} entry drafts"))
+            report.append(self.style.SUCCESS(f"Created {revision_chains_created} revision chains"))
 
             # Display data quality metrics
-            self.stdout.write(self.style.SUCCESS("\nData Quality Metrics:"))
-            self.stdout.write(self.style.SUCCESS(f"  Total drafts: {metrics['total_drafts']}"))
+            report.append(self.style.SUCCESS("\nData Quality Metrics:"))
+            report.append(self.style.SUCCESS(f"  Total drafts: {metrics['total_drafts']}"))
             published_pct = (
                 metrics["published_drafts"] / metrics["total_drafts"] * 100 if metrics["total_drafts"] > 0 else 0
             )
-            self.stdout.write(
+            report.append(
                 self.style.SUCCESS(f"  Published drafts: {metrics['published_drafts']} " f"({published_pct:.1f}%)")
             )
             endorsed_pct = (
                 metrics["endorsed_drafts"] / metrics["total_drafts"] * 100 if metrics["total_drafts"] > 0 else 0
             )
-            self.stdout.write(
+            report.append(
                 self.style.SUCCESS(f"  Endorsed drafts: {metrics['endorsed_drafts']} " f"({endorsed_pct:.1f}%)")
             )
-            self.stdout.write(self.style.SUCCESS(f"  Drafts in revision chains: {metrics['revision_chains']}"))
-            self.stdout.write(self.style.SUCCESS(f"  Curator involvement: {metrics['curator_involvement']} drafts"))
+            report.append(self.style.SUCCESS(f"  Drafts in revision chains: {metrics['revision_chains']}"))
+            report.append(self.style.SUCCESS(f"  Curator involvement: {metrics['curator_involvement']} drafts"))
 
             if "timestamp_span_days" in metrics:
-                self.stdout.write(self.style.SUCCESS(f"  Timestamp span: {metrics['timestamp_span_days']} days"))
+                report.append(self.style.SUCCESS(f"  Timestamp span: {metrics['timestamp_span_days']} days"))
 
             # Approval distribution
-            self.stdout.write(self.style.SUCCESS("\nApproval Distribution:"))
+            report.append(self.style.SUCCESS("\nApproval Distribution:"))
             for key, count in metrics["approval_distribution"].items():
                 percentage = count / metrics["total_drafts"] * 100 if metrics["total_drafts"] > 0 else 0
-                self.stdout.write(self.style.SUCCESS(f"  {key.replace('_', ' ').title()}: {count} ({percentage:.1f}%)"))
+                report.append(self.style.SUCCESS(f"  {key.replace('_', ' ').title()}: {count} ({percentage:.1f}%)"))
 
             # Entry-level validation metrics
-            self.stdout.write(self.style.SUCCESS("\nEntry State Distribution:"))
-            self.stdout.write(
+            report.append(self.style.SUCCESS("\nEntry State Distribution:"))
+            report.append(
                 self.style.SUCCESS(
                     f"  Entries with only unpublished drafts: "
                     f"{metrics['entries_with_only_unpublished']} "
                     f"(should not appear in glossary)"
                 )
             )
-            self.stdout.write(
+            report.append(
                 self.style.SUCCESS(
                     f"  Entries with published drafts: {metrics['entries_with_published']} (should appear in glossary)"
                 )
             )
-            self.stdout.write(
+            report.append(
                 self.style.SUCCESS(
                     f"  Entries with both published and unpublished: "
                     f"{metrics['entries_with_both_states']} "
@@ -748,8 +867,10 @@ class Command(BaseCommand):
                 )
             )
 
-            self.stdout.write(self.style.SUCCESS("\nLogin credentials:"))
-            self.stdout.write(self.style.SUCCESS("  Superuser: admin / admin"))
-            self.stdout.write(
+            report.append(self.style.SUCCESS("\nLogin credentials:"))
+            report.append(self.style.SUCCESS("  Superuser: admin / admin"))
+            report.append(
                 self.style.SUCCESS("  Test users: <username> / ImABird " "(most users, all but the last one)")
             )
+
+            self.stdout.write("\n".join(report))
@@ -1,5 +1,9 @@
+from django.contrib.auth.models import User
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
+from django.db import connection
+
+from glossary.models import Entry, EntryDraft, Perspective
 
 
 class Command(BaseCommand):
@@ -39,34 +43,24 @@ class Command(BaseCommand):
 
     def verify_database_state(self):
         """Verify that the database has the expected test data"""
-        from django.contrib.auth.models import User
-
-        from glossary.models import Entry, EntryDraft, Perspective
+        # Count users and live perspectives, entries and drafts in a single round trip
+        live_count = "(SELECT COUNT(*) FROM {} WHERE is_deleted = %s)"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT (SELECT COUNT(*) FROM {}), {}, {}, {}".format(
+                    User._meta.db_table,
+                    *(live_count.format(model._meta.db_table) for model in (Perspective, Entry, EntryDraft)),
+                ),
+                [False] * 3,
+            )
+            user_count, perspective_count, entry_count, draft_count = cursor.fetchone()
 
-        # Check users
-        user_count = User.objects.count()
         self.stdout.write(f"👥 Users: {user_count}")
-
-        # Check perspectives
-        perspective_count = Perspective.objects.count()
         self.stdout.write(f"🏷️  Perspectives: {perspective_count}")
-
-        # Check entries
-        entry_count = Entry.objects.count()
         self.stdout.write(f"📝 Entries: {entry_count}")
-
-        # Check drafts
-        draft_count = EntryDraft.objects.count()
         self.stdout.write(f"📄 Drafts: {draft_count}")
 
-        # Verify admin user exists
-        admin_exists = User.objects.filter(username="admin").exists()
-        if admin_exists:
-            self.stdout.write(self.style.SUCCESS("✅ Admin user exists"))
-        else:
-            self.stdout.write(self.style.WARNING("⚠️  Admin user not found"))
-
-        # Verify test users exist
+        # Verify the admin and test users exist, fetching all of their usernames at once
         test_users = [
             "mariacarter",
             "bencarter",
@@ -74,8 +68,17 @@ class Command(BaseCommand):
             "leoschmidt",
             "kenjitanaka",
         ]
+        existing_usernames = set(
+            User.objects.filter(username__in=["admin", *test_users]).values_list("username", flat=True)
+        )
+
+        if "admin" in existing_usernames:
+            self.stdout.write(self.style.SUCCESS("✅ Admin user exists"))
+        else:
+            self.stdout.write(self.style.WARNING("⚠️  Admin user not found"))
+
         for username in test_users:
-            if User.objects.filter(username=username).exists():
+            if username in existing_usernames:
                 self.stdout.write(f"✅ Test user {username} exists")
             else:
                 self.stdout.write(self.style.WARNING(f"⚠️  Test user {username} not found"))
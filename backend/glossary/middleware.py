@@ -2,15 +2,73 @@
 Custom middleware for Termageddon
 """
 
+import hashlib
 import logging
 
 from rest_framework.authtoken.models import Token
 
-from django.contrib.auth import get_user_model
+from django.contrib.auth import get_user_model, login
+from django.core.cache import cache
+from django.http import Http404
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+# File extensions that never correspond to an Angular route
+STATIC_FILE_EXTENSIONS = frozenset(
+    {
+        "ico",
+        "png",
+        "jpg",
+        "jpeg",
+        "gif",
+        "svg",
+        "css",
+        "js",
+        "woff",
+        "woff2",
+        "ttf",
+        "eot",
+        "json",
+        "xml",
+        "txt",
+        "pdf",
+        "zip",
+        "tar",
+        "gz",
+    }
+)
+
+# Path prefixes served by Django itself rather than the Angular frontend
+BACKEND_PATH_PREFIXES = ("/admin", "/api", "/health", "/static")
+
+# Seconds to remember a token that cannot open an admin session (unknown key or non-staff user)
+REJECTED_TOKEN_CACHE_TIMEOUT = 60
+
+
+class SPAStaticFileMiddleware:
+    """
+    Middleware to return 404 for missing static files instead of the Angular app.
+
+    The frontend catch-all route serves index.html for any path outside the backend
+    prefixes. Requests for asset-like paths (e.g. /missing.js) should not receive
+    index.html, so they are rejected here with a set lookup on the file extension
+    rather than a regex alternation in the catch-all pattern.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        path = request.path_info
+        if not path.startswith(BACKEND_PATH_PREFIXES):
+            # Only the final path segment can carry a file extension
+            _, dot, extension = path.rpartition("/")[2].rpartition(".")
+            if dot and extension.lower() in STATIC_FILE_EXTENSIONS:
+                raise Http404("Static file not found")
+
+        return self.get_response(request)
+
 
 class TokenToSessionMiddleware:
     """
@@ -40,23 +98,32 @@ class TokenToSessionMiddleware:
             if not token_key:
                 token_key = request.COOKIES.get("auth_token")
 
+            # Tokens rejected recently are skipped without a database lookup; the cache key is a hash
+            # so raw tokens are never stored in the cache
+            rejected_cache_key = None
+            if token_key:
+                rejected_cache_key = "admin_token_rejected:" + hashlib.sha256(token_key.encode()).hexdigest()
+                if cache.get(rejected_cache_key):
+                    token_key = None
+
             if token_key:
                 try:
                     token = Token.objects.select_related("user").get(key=token_key)
                     user = token.user
 
                     # Check if user is staff (required for admin access)
-                    if user.is_staff:
+                    if not user.is_staff:
+                        cache.set(rejected_cache_key, True, REJECTED_TOKEN_CACHE_TIMEOUT)
+                    else:
                         # Log user into Django session
                         # Set backend attribute required by login()
                         user.backend = "django.contrib.auth.backends.ModelBackend"
-                        from django.contrib.auth import login
-
                         login(request, user)
                         logger.info(
                             f"TokenToSessionMiddleware: Auto-authenticated user {user.username} for admin access"
                         )
                 except Token.DoesNotExist:
+                    cache.set(rejected_cache_key, True, REJECTED_TOKEN_CACHE_TIMEOUT)
                     logger.debug("TokenToSessionMiddleware: Invalid token attempted for admin access")
                 except Exception as e:
                     logger.warning(f"TokenToSessionMiddleware: Error during token authentication: {e}")
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.10 on 2026-10-16 22:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0004_entrydraftapprover_entrydraftrequestedreviewer_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_at"],
+                name="gl_co_live_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_at"],
+                name="gl_en_live_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entrydraft",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_at"],
+                name="gl_ed_live_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="perspective",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_at"],
+                name="gl_pe_live_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="term",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_at"],
+                name="gl_te_live_created_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="entry",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name="perspective",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name="term",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.10 on 2026-10-16 22:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0005_add_deleted_created_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="entrydraft",
+            index=models.Index(
+                condition=models.Q(
+                    ("is_archived", False),
+                    ("is_deleted", False),
+                    ("is_published", False),
+                ),
+                fields=["created_at"],
+                name="gl_ed_archivable_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.10 on 2026-10-16 22:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0006_add_archivable_drafts_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="entrydraft",
+            index=models.Index(
+                fields=["entry", "is_deleted", "-created_at"],
+                name="gl_ed_entry_del_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_at"],
+                name="gl_no_live_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reaction",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["created_at"],
+                name="gl_re_live_created_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name="reaction",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+    ]
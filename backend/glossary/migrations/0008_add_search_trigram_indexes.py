@@ -0,0 +1,41 @@
+from django.db import migrations
+
+# Admin search runs icontains lookups, which PostgreSQL renders as UPPER("column"::text) LIKE UPPER(%s).
+# Trigram indexes on the same expression let those leading-wildcard searches avoid a sequential scan.
+TRIGRAM_INDEXES = [
+    ("gl_te_text_trgm_idx", "glossary_term", "text"),
+    ("gl_te_text_norm_trgm_idx", "glossary_term", "text_normalized"),
+    ("gl_ed_content_trgm_idx", "glossary_entry_draft", "content"),
+    ("gl_co_text_trgm_idx", "glossary_comment", "text"),
+    ("gl_no_message_trgm_idx", "glossary_notification", "message"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    # The pg_trgm extension is left installed; other objects may depend on it
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0007_add_soft_delete_composite_indexes"),
+    ]
+
+    operations = [
+        # No-op on databases other than PostgreSQL
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-16 23:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0008_add_search_trigram_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="entrydraft",
+            index=models.Index(
+                condition=models.Q(("replaces_draft__isnull", False)),
+                fields=["replaces_draft", "created_at"],
+                name="gl_ed_chain_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.10 on 2026-10-16 23:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0009_add_revision_chain_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="userprofile",
+            name="okta_id",
+            field=models.CharField(
+                blank=True,
+                help_text="Okta user ID (sub claim) for OAuth authentication",
+                max_length=255,
+                null=True,
+                unique=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.10 on 2026-10-16 23:36
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+# Model name and the fields each new constraint makes unique among non-deleted rows
+LIVE_UNIQUE_FIELDS = [
+    ("Perspective", ("name",)),
+    ("Term", ("text",)),
+    ("Entry", ("term", "perspective")),
+    ("PerspectiveCurator", ("user", "perspective")),
+]
+
+
+def soft_delete_live_duplicates(apps, schema_editor):
+    """Keep the first live row of each unique key and soft-delete the others, so the constraints can be added"""
+    for model_name, fields in LIVE_UNIQUE_FIELDS:
+        model = apps.get_model("glossary", model_name)
+        live = model._base_manager.filter(is_deleted=False)
+        duplicates = live.values(*fields).annotate(first_id=Min("id"), rows=Count("id")).filter(rows__gt=1)
+        for key in duplicates:
+            live.filter(**{field: key[field] for field in fields}).exclude(id=key["first_id"]).update(is_deleted=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0010_remove_redundant_okta_id_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(soft_delete_live_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="entry",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_deleted", False)),
+                fields=("term", "perspective"),
+                name="gl_en_unique_live_term_persp",
+                violation_error_message="An entry for this term and perspective combination already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="perspective",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_deleted", False)),
+                fields=("name",),
+                name="gl_pe_unique_live_name",
+                violation_error_code="unique",
+                violation_error_message="A perspective with this name already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="perspectivecurator",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_deleted", False)),
+                fields=("user", "perspective"),
+                name="gl_pc_unique_live_user_persp",
+                violation_error_message="This user is already a perspective curator for this perspective.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="term",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_deleted", False)),
+                fields=("text",),
+                name="gl_te_unique_live_text",
+                violation_error_code="unique",
+                violation_error_message="A term with this text already exists.",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.10 on 2026-10-16 23:42
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_approval_counts(apps, schema_editor):
+    EntryDraft = apps.get_model("glossary", "EntryDraft")
+    EntryDraftApprover = apps.get_model("glossary", "EntryDraftApprover")
+    counts = (
+        EntryDraftApprover.objects.filter(entrydraft=OuterRef("pk"))
+        .order_by()
+        .values("entrydraft")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    EntryDraft.objects.update(approval_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0011_add_live_unique_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="entrydraft",
+            name="approval_count",
+            field=models.PositiveSmallIntegerField(
+                db_index=True,
+                default=0,
+                editable=False,
+                help_text="Number of approvers (kept in step with the approvers relation)",
+            ),
+        ),
+        migrations.RunPython(backfill_approval_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.10 on 2026-10-16 23:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0012_add_draft_approval_count"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="comment",
+            name="is_resolved",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name="entrydraft",
+            name="is_published",
+            field=models.BooleanField(
+                default=False,
+                help_text="Whether this draft has been published as active",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="term",
+            name="is_official",
+            field=models.BooleanField(default=False, help_text="Indicates term has official status"),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.10 on 2026-10-16 23:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0013_drop_boolean_single_column_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="comment",
+            name="gl_co_resolved_created_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entrydraft",
+            name="gl_en_arch_pub_created_idx",
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False), ("is_resolved", False)),
+                fields=["created_at"],
+                name="gl_co_unresolved_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# gl_ed_entry_del_created_idx serves "latest draft per entry" subqueries (EntryAdmin changelist, the draft
+# review list). On PostgreSQL it is rebuilt under the same name with id and is_published as non-key columns,
+# so those subqueries, which only read id/created_at and filter on is_published, can use index-only scans.
+INDEX_NAME = "gl_ed_entry_del_created_idx"
+TABLE = "glossary_entry_draft"
+KEY_COLUMNS = '"entry_id", "is_deleted", "created_at" DESC'
+
+
+def add_covering_columns(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+    schema_editor.execute(f'CREATE INDEX "{INDEX_NAME}" ON "{TABLE}" ({KEY_COLUMNS}) INCLUDE ("id", "is_published")')
+
+
+def remove_covering_columns(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+    schema_editor.execute(f'CREATE INDEX "{INDEX_NAME}" ON "{TABLE}" ({KEY_COLUMNS})')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0014_replace_boolean_led_indexes"),
+    ]
+
+    operations = [
+        # No-op on databases other than PostgreSQL
+        migrations.RunPython(add_covering_columns, remove_covering_columns),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.10 on 2026-10-16 23:56
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_approvals(apps, schema_editor):
+    """Keep the first row of each (draft, user) pair and recount the drafts that had duplicates"""
+    EntryDraft = apps.get_model("glossary", "EntryDraft")
+    EntryDraftApprover = apps.get_model("glossary", "EntryDraftApprover")
+    duplicates = (
+        EntryDraftApprover.objects.values("entrydraft", "user")
+        .annotate(first_id=Min("id"), rows=Count("id"))
+        .filter(rows__gt=1)
+    )
+    for pair in duplicates:
+        EntryDraftApprover.objects.filter(entrydraft=pair["entrydraft"], user=pair["user"]).exclude(
+            id=pair["first_id"]
+        ).delete()
+        EntryDraft.objects.filter(pk=pair["entrydraft"]).update(
+            approval_count=EntryDraftApprover.objects.filter(entrydraft=pair["entrydraft"]).count()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("glossary", "0016_use_brin_for_draft_comment_created_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_approvals, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="entrydraftapprover",
+            name="gl_ed_approvers_draft_user_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="entrydraftapprover",
+            constraint=models.UniqueConstraint(fields=("entrydraft", "user"), name="gl_ed_approvers_unique_draft_user"),
+        ),
+    ]
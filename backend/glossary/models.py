@@ -7,8 +7,9 @@ from unidecode import unidecode
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models.signals import post_save
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
@@ -33,7 +34,9 @@ class AllObjectsManager(models.Manager):
 class AuditedModel(models.Model):
     """Abstract base model with audit fields and soft delete functionality"""
 
-    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Not indexed here: models that are listed by date index created_at over their live rows
+    # (see the *_live_created_idx indexes) or declare their own index
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
     updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
     created_by: models.ForeignKey[User, User] = models.ForeignKey(
         User,
@@ -60,12 +63,23 @@ class AuditedModel(models.Model):
     def delete(self, using=None, keep_parents=False):
         """Soft delete - set is_deleted flag instead of actually deleting"""
         self.is_deleted = True
-        self.save(using=using)
+        # Only the flag changes: skip full_clean() and the subclass save() hooks, and write just these columns
+        super().save(using=using, update_fields=["is_deleted", "updated_at"])
 
     def hard_delete(self, using=None, keep_parents=False):
         """Actually delete the object from the database"""
         super().delete(using=using, keep_parents=keep_parents)
 
+    def clean_fields(self, exclude=None):
+        """Validate fields, skipping the existence query for foreign keys whose saved target is already loaded"""
+        exclude = set(exclude or ())
+        for field in self._meta.concrete_fields:
+            if field.many_to_one and field.is_cached(self):
+                related = field.get_cached_value(self)
+                if related is not None and related.pk is not None and related.pk == getattr(self, field.attname):
+                    exclude.add(field.name)
+        super().clean_fields(exclude=exclude)
+
 
 class Perspective(AuditedModel):
     """Perspective or category for terms (e.g., 'Finance', 'Technology')"""
@@ -76,17 +90,28 @@ class Perspective(AuditedModel):
 
     class Meta:
         db_table = "glossary_perspective"
+        constraints = [
+            # Unique among non-deleted records; checked by full_clean() and enforced by the database
+            models.UniqueConstraint(
+                fields=["name"],
+                condition=Q(is_deleted=False),
+                name="gl_pe_unique_live_name",
+                violation_error_message="A perspective with this name already exists.",
+                # Keeps the error keyed by the field, as the old clean() check did
+                violation_error_code="unique",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                name="gl_pe_live_created_idx",
+                condition=Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
-    def clean(self):
-        """Validate uniqueness among non-deleted records"""
-        super().clean()
-        existing = Perspective.all_objects.filter(name=self.name, is_deleted=False).exclude(pk=self.pk).exists()
-        if existing:
-            raise ValidationError({"name": "A perspective with this name already exists."})
-
     def save(self, *args, **kwargs):
         # Auto-populate name_normalized
         self.name_normalized = unidecode(self.name.lower())
@@ -102,22 +127,32 @@ class Term(AuditedModel):
     is_official: models.BooleanField = models.BooleanField(
         default=False,
         help_text="Indicates term has official status",
-        db_index=True,
     )
 
     class Meta:
         db_table = "glossary_term"
+        constraints = [
+            # Unique among non-deleted records; checked by full_clean() and enforced by the database
+            models.UniqueConstraint(
+                fields=["text"],
+                condition=Q(is_deleted=False),
+                name="gl_te_unique_live_text",
+                violation_error_message="A term with this text already exists.",
+                # Keeps the error keyed by the field, as the old clean() check did
+                violation_error_code="unique",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                name="gl_te_live_created_idx",
+                condition=Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return self.text
 
-    def clean(self):
-        """Validate uniqueness among non-deleted records"""
-        super().clean()
-        existing = Term.all_objects.filter(text=self.text, is_deleted=False).exclude(pk=self.pk).exists()
-        if existing:
-            raise ValidationError({"text": "A term with this text already exists."})
-
     def save(self, *args, **kwargs):
         # Auto-populate text_normalized
         self.text_normalized = unidecode(self.text.lower())
@@ -139,6 +174,15 @@ class Entry(AuditedModel):
 
     class Meta:
         db_table = "glossary_entry"
+        constraints = [
+            # Unique among non-deleted records; checked by full_clean() and enforced by the database
+            models.UniqueConstraint(
+                fields=["term", "perspective"],
+                condition=Q(is_deleted=False),
+                name="gl_en_unique_live_term_persp",
+                violation_error_message="An entry for this term and perspective combination already exists.",
+            ),
+        ]
         indexes = [
             models.Index(
                 fields=["term", "perspective", "is_deleted"],
@@ -152,22 +196,16 @@ class Entry(AuditedModel):
                 fields=["perspective", "is_deleted"],
                 name="glossary_en_persp_del_idx",
             ),
+            models.Index(
+                fields=["created_at"],
+                name="gl_en_live_created_idx",
+                condition=Q(is_deleted=False),
+            ),
         ]
 
     def __str__(self):
         return f"{self.term.text} ({self.perspective.name})"
 
-    def clean(self):
-        """Validate term+perspective uniqueness among non-deleted records"""
-        super().clean()
-        existing = (
-            Entry.all_objects.filter(term=self.term, perspective=self.perspective, is_deleted=False)
-            .exclude(pk=self.pk)
-            .exists()
-        )
-        if existing:
-            raise ValidationError("An entry for this term and perspective combination already exists.")
-
     def get_latest_draft(self):
         """Get the most recent draft by created_at (any state)"""
         return self.drafts.order_by("-created_at").first()
@@ -206,10 +244,11 @@ class EntryDraftApprover(models.Model):
 
     class Meta:
         db_table = "glossary_entry_draft_approvers"
-        indexes = [
-            models.Index(
+        constraints = [
+            # One approval per user and draft; EntryDraft.approve() relies on it instead of checking first
+            models.UniqueConstraint(
                 fields=["entrydraft", "user"],
-                name="gl_ed_approvers_draft_user_idx",
+                name="gl_ed_approvers_unique_draft_user",
             ),
         ]
 
@@ -233,6 +272,9 @@ class EntryDraftRequestedReviewer(models.Model):
 class EntryDraft(AuditedModel):
     """A draft of an entry's definition - requires approval to become active"""
 
+    # No standalone btree: composite and partial indexes serve the orderings, and migration 0016 adds a
+    # BRIN index for date-range scans on PostgreSQL
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
     entry: models.ForeignKey[Entry, Entry] = models.ForeignKey(Entry, on_delete=models.CASCADE, related_name="drafts")
     content: models.TextField = models.TextField(help_text="Rich HTML content (sanitized on save)")
     author: models.ForeignKey[User, User] = models.ForeignKey(
@@ -248,10 +290,15 @@ class EntryDraft(AuditedModel):
         help_text="Users specifically requested to review this draft",
         through="EntryDraftRequestedReviewer",
     )
+    approval_count: models.PositiveSmallIntegerField = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        db_index=True,
+        help_text="Number of approvers (kept in step with the approvers relation)",
+    )
     is_published: models.BooleanField = models.BooleanField(
         default=False,
         help_text="Whether this draft has been published as active",
-        db_index=True,
     )
     endorsed_by: models.ForeignKey[User, User] = models.ForeignKey(
         User,
@@ -281,10 +328,6 @@ class EntryDraft(AuditedModel):
         db_table = "glossary_entry_draft"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(
-                fields=["is_archived", "is_published", "created_at"],
-                name="gl_en_arch_pub_created_idx",
-            ),
             models.Index(
                 fields=["entry", "is_published", "is_deleted", "published_at"],
                 name="gl_en_entry_pub_del_pubat",
@@ -297,6 +340,30 @@ class EntryDraft(AuditedModel):
                 fields=["author", "is_deleted", "created_at"],
                 name="gl_en_author_del_created",
             ),
+            models.Index(
+                fields=["created_at"],
+                name="gl_ed_live_created_idx",
+                condition=Q(is_deleted=False),
+            ),
+            # Latest live draft per entry (Entry.get_latest_draft, EntryAdmin changelist); migration 0015 adds
+            # INCLUDE (id, is_published) on PostgreSQL
+            models.Index(
+                fields=["entry", "is_deleted", "-created_at"],
+                name="gl_ed_entry_del_created_idx",
+            ),
+            # Partial index for the draft review list and archive_old_drafts: only live, unpublished,
+            # unarchived drafts
+            models.Index(
+                fields=["created_at"],
+                name="gl_ed_archivable_created_idx",
+                condition=Q(is_published=False, is_archived=False, is_deleted=False),
+            ),
+            # Partial index for revision chain checks: only drafts that replace another draft
+            models.Index(
+                fields=["replaces_draft", "created_at"],
+                name="gl_ed_chain_created_idx",
+                condition=Q(replaces_draft__isnull=False),
+            ),
         ]
 
     def __str__(self):
@@ -305,12 +372,7 @@ class EntryDraft(AuditedModel):
     @property
     def is_approved(self):
         """Check if this draft has enough approvals"""
-        return self.approvers.count() >= settings.MIN_APPROVALS
-
-    @property
-    def approval_count(self):
-        """Return the number of approvals"""
-        return self.approvers.count()
+        return self.approval_count >= settings.MIN_APPROVALS
 
     @property
     def is_endorsed(self):
@@ -339,10 +401,25 @@ class EntryDraft(AuditedModel):
         if user == self.author:
             raise ValidationError("Authors cannot approve their own drafts.")
 
-        if self.approvers.filter(pk=user.pk).exists():
+        # The unique constraint rejects a repeat approval, so the insert needs no lookup first
+        try:
+            with transaction.atomic():
+                EntryDraftApprover.objects.create(entrydraft=self, user=user)
+        except IntegrityError:
             raise ValidationError("You have already approved this draft.")
+        # approvers.add() would drop a prefetched approvers list; do the same so callers see the new approval
+        getattr(self, "_prefetched_objects_cache", {}).pop("approvers", None)
+        # Send the signal approvers.add() would have sent (approval count, draft_approved notification)
+        m2m_changed.send(
+            sender=EntryDraftApprover,
+            instance=self,
+            action="post_add",
+            reverse=False,
+            model=User,
+            pk_set={user.pk},
+            using=self._state.db,
+        )
 
-        self.approvers.add(user)
         # Remove user from requested reviewers since they've now approved
         self.requested_reviewers.remove(user)
 
@@ -359,7 +436,11 @@ class EntryDraft(AuditedModel):
 
     def clear_approvals(self):
         """Clear all approvals (used when content is edited)"""
-        self.approvers.clear()
+        # Delete the join rows and reset the stored count directly rather than via the m2m_changed handlers
+        EntryDraftApprover.objects.filter(entrydraft=self).delete()
+        EntryDraft.all_objects.filter(pk=self.pk).update(approval_count=0)
+        self.approval_count = 0
+        getattr(self, "_prefetched_objects_cache", {}).pop("approvers", None)
 
     def publish(self, user):
         """Publish this draft as the active draft"""
@@ -372,25 +453,51 @@ class EntryDraft(AuditedModel):
         # Mark as published and set published_at timestamp
         self.is_published = True
         self.published_at = timezone.now()
-        self.save()
+        self.save(update_fields=["is_published", "published_at", "updated_at"])
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored content so save() can tell whether it changed without refetching the row
+        if "content" in instance.__dict__:
+            instance._loaded_content = instance.content
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        if fields is None or "content" in fields:
+            self._loaded_content = self.content
 
     def save(self, *args, **kwargs):
-        # If content is being updated and there are existing approvals, clear them
+        # If content is being updated, clear any approvals. The in-memory approval_count may be stale,
+        # so the approver rows are deleted whether or not this instance has seen any.
         if self.pk:
-            try:
-                old_draft = EntryDraft.objects.get(pk=self.pk)
-                if old_draft.content != self.content and old_draft.approvers.exists():
-                    self.clear_approvals()
-            except EntryDraft.DoesNotExist:
-                pass
+            if "_loaded_content" not in self.__dict__:
+                # Not loaded with its content (e.g. deferred or built by hand); the pre_save signal reuses this
+                self._loaded_content = EntryDraft.objects.filter(pk=self.pk).values_list("content", flat=True).first()
+            if self._loaded_content not in (None, self.content):
+                self.clear_approvals()
+
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            # approval_count is only written by the approvers m2m handlers and update_approval_counts();
+            # leave it out of ordinary saves so an instance loaded earlier cannot overwrite a newer count
+            skipped = self.get_deferred_fields() | {"approval_count"}
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in skipped
+            ]
 
         self.full_clean()
         super().save(*args, **kwargs)
+        self._loaded_content = self.content
 
 
 class Comment(AuditedModel):
     """Comments are attached to EntryDraft models"""
 
+    # Indexed like EntryDraft.created_at (BRIN on PostgreSQL, see migration 0016)
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
     draft: models.ForeignKey[EntryDraft, EntryDraft] = models.ForeignKey(
         EntryDraft,
         on_delete=models.CASCADE,
@@ -413,7 +520,7 @@ class Comment(AuditedModel):
         blank=True,
         help_text="Users mentioned in this comment via @mention",
     )
-    is_resolved: models.BooleanField = models.BooleanField(default=False, db_index=True)
+    is_resolved: models.BooleanField = models.BooleanField(default=False)
     edited_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
 
     class Meta:
@@ -433,13 +540,19 @@ class Comment(AuditedModel):
                 name="gl_co_draft_resolved_created",
             ),
             models.Index(
-                fields=["is_resolved", "created_at"],
-                name="gl_co_resolved_created_idx",
+                fields=["created_at"],
+                name="gl_co_unresolved_created_idx",
+                condition=Q(is_resolved=False, is_deleted=False),
+            ),
+            models.Index(
+                fields=["created_at"],
+                name="gl_co_live_created_idx",
+                condition=Q(is_deleted=False),
             ),
         ]
 
     def __str__(self):
-        return f"Comment by {self.author.username} on draft {self.draft.id}"
+        return f"Comment by {self.author.username} on draft {self.draft_id}"
 
     def clean(self):
         """Validate that only top-level comments can be resolved"""
@@ -450,14 +563,11 @@ class Comment(AuditedModel):
     def save(self, *args, **kwargs):
         # Track if text is being updated (for edited_at timestamp)
         if self.pk:
-            try:
-                old_comment = Comment.objects.get(pk=self.pk)
-                if old_comment.text != self.text:
-                    from django.utils import timezone
-
-                    self.edited_at = timezone.now()
-            except Comment.DoesNotExist:
-                pass
+            old_text = Comment.objects.filter(pk=self.pk).values_list("text", flat=True).first()
+            if old_text is not None and old_text != self.text:
+                from django.utils import timezone
+
+                self.edited_at = timezone.now()
         self.full_clean()
         super().save(*args, **kwargs)
 
@@ -487,9 +597,16 @@ class Reaction(AuditedModel):
         db_table = "glossary_reaction"
         unique_together = [["comment", "user", "reaction_type"]]
         ordering = ["created_at"]
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                name="gl_re_live_created_idx",
+                condition=Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.user.username} {self.reaction_type} on comment {self.comment.id}"
+        return f"{self.user.username} {self.reaction_type} on comment {self.comment_id}"
 
     def clean(self):
         """Validate reaction data"""
@@ -546,6 +663,11 @@ class Notification(AuditedModel):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["user", "is_read", "-created_at"]),
+            models.Index(
+                fields=["created_at"],
+                name="gl_no_live_created_idx",
+                condition=Q(is_deleted=False),
+            ),
         ]
 
     def __str__(self):
@@ -559,6 +681,8 @@ class Notification(AuditedModel):
 class PerspectiveCurator(AuditedModel):
     """Tracks which users are curators for which perspectives"""
 
+    # No live-row created_at index on this model, so it keeps the plain one
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True, db_index=True)
     user: models.ForeignKey[User, User] = models.ForeignKey(User, on_delete=models.CASCADE, related_name="curatorship")
     perspective: models.ForeignKey[Perspective, Perspective] = models.ForeignKey(
         Perspective, on_delete=models.CASCADE, related_name="curators"
@@ -573,6 +697,15 @@ class PerspectiveCurator(AuditedModel):
 
     class Meta:
         db_table = "glossary_perspective_curator"
+        constraints = [
+            # Unique among non-deleted records; checked by full_clean() and enforced by the database
+            models.UniqueConstraint(
+                fields=["user", "perspective"],
+                condition=Q(is_deleted=False),
+                name="gl_pc_unique_live_user_persp",
+                violation_error_message="This user is already a perspective curator for this perspective.",
+            ),
+        ]
         indexes = [
             models.Index(
                 fields=["user", "is_deleted"],
@@ -587,17 +720,6 @@ class PerspectiveCurator(AuditedModel):
     def __str__(self):
         return f"{self.user.username} - {self.perspective.name}"
 
-    def clean(self):
-        """Validate user+perspective uniqueness among non-deleted records"""
-        super().clean()
-        existing = (
-            PerspectiveCurator.all_objects.filter(user=self.user, perspective=self.perspective, is_deleted=False)
-            .exclude(pk=self.pk)
-            .exists()
-        )
-        if existing:
-            raise ValidationError("This user is already a perspective curator for this perspective.")
-
     def save(self, *args, **kwargs):
         self.full_clean()
         super().save(*args, **kwargs)
@@ -612,6 +734,8 @@ def is_perspective_curator_for(user, perspective_id):
 class UserProfile(AuditedModel):
     """User profile extending Django's built-in User model"""
 
+    # No live-row created_at index on this model, so it keeps the plain one
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True, db_index=True)
     user: models.OneToOneField[User, User] = models.OneToOneField(
         User, on_delete=models.CASCADE, related_name="profile"
     )
@@ -623,7 +747,6 @@ class UserProfile(AuditedModel):
         blank=True,
         null=True,
         unique=True,
-        db_index=True,
         help_text="Okta user ID (sub claim) for OAuth authentication",
     )
 
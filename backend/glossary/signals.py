@@ -1,9 +1,12 @@
 import threading
 
+from django.conf import settings
+from django.db.models import Count, Exists, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.db.models.signals import m2m_changed, post_save, pre_save
 from django.dispatch import receiver
 
-from glossary.models import Comment, EntryDraft, Notification
+from glossary.models import Comment, EntryDraft, EntryDraftApprover, Notification
 
 # Thread-local storage to track old content before save
 _thread_locals = threading.local()
@@ -12,12 +15,11 @@ _thread_locals = threading.local()
 @receiver(pre_save, sender=EntryDraft)
 def store_old_draft_content(*args, instance, **kwargs):
     """Store old draft content before save for comparison"""
-    if instance.pk:
-        try:
-            old_draft = EntryDraft.objects.get(pk=instance.pk)
-            _thread_locals.old_content = old_draft.content
-        except EntryDraft.DoesNotExist:
-            _thread_locals.old_content = None
+    if "_loaded_content" in instance.__dict__:
+        # Content as loaded from the database (see EntryDraft.from_db and EntryDraft.save)
+        _thread_locals.old_content = instance._loaded_content
+    elif instance.pk:
+        _thread_locals.old_content = EntryDraft.objects.filter(pk=instance.pk).values_list("content", flat=True).first()
     else:
         _thread_locals.old_content = None
 
@@ -50,31 +52,97 @@ def notify_draft_edited(*args, instance, created, **kwargs):
             pass  # Silently fail if notification creation fails
 
 
+def update_approval_counts(drafts):
+    """
+    Recount EntryDraft.approval_count for the given drafts from the approvers table.
+
+    Used directly by bulk code paths that insert or delete EntryDraftApprover rows
+    without sending m2m_changed.
+    """
+    counts = (
+        EntryDraftApprover.objects.filter(entrydraft=OuterRef("pk"))
+        .order_by()
+        .values("entrydraft")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return EntryDraft.all_objects.filter(pk__in=[draft.pk for draft in drafts]).update(
+        approval_count=Coalesce(Subquery(counts), Value(0))
+    )
+
+
+def create_draft_approved_notifications(approvals):
+    """
+    Notify authors of drafts that have reached MIN_APPROVALS.
+
+    approvals maps each draft to the users whose approvals were just recorded.
+    Drafts that are not yet approved, or whose author already has a draft_approved
+    notification, are skipped. Used directly by bulk code paths that insert
+    EntryDraftApprover rows without sending m2m_changed.
+    """
+    if not approvals:
+        return []
+
+    drafts_by_id = {draft.pk: draft for draft in approvals}
+    # The term text comes back with the ids rather than through draft.entry.term per draft
+    approved_drafts = (
+        EntryDraft.all_objects.filter(pk__in=drafts_by_id, approval_count__gte=settings.MIN_APPROVALS)
+        .exclude(
+            # Avoid duplicates when approvers are added in several steps
+            Exists(
+                Notification.objects.filter(
+                    user=OuterRef("author"),
+                    type="draft_approved",
+                    related_draft=OuterRef("pk"),
+                )
+            )
+        )
+        .values_list("pk", "entry__term__text")
+    )
+
+    notifications = []
+    for draft_id, term_text in approved_drafts:
+        draft = drafts_by_id[draft_id]
+        approver_names = ", ".join([approver.get_full_name() or approver.username for approver in approvals[draft]])
+        notifications.append(
+            Notification(
+                user_id=draft.author_id,
+                type="draft_approved",
+                message=f"Your draft for '{term_text}' was approved by {approver_names}",
+                related_draft=draft,
+            )
+        )
+    return Notification.objects.bulk_create(notifications)
+
+
 @receiver(m2m_changed, sender=EntryDraft.approvers.through)
-def notify_draft_approved(*args, instance, action, pk_set, **kwargs):
+def update_draft_approval_count(*args, instance, action, reverse, pk_set, **kwargs):
+    """Keep the denormalized approval_count in step with approvers added or removed"""
+    if action in ("post_add", "post_remove") and pk_set:
+        step = 1 if action == "post_add" else -1
+        if reverse:
+            # instance is the approving user and pk_set holds the draft ids
+            EntryDraft.all_objects.filter(pk__in=pk_set).update(approval_count=F("approval_count") + step)
+        else:
+            delta = step * len(pk_set)
+            EntryDraft.all_objects.filter(pk=instance.pk).update(approval_count=F("approval_count") + delta)
+            instance.approval_count += delta
+    elif action == "pre_clear" and reverse:
+        # pk_set is not sent for clear(), so decrement the user's drafts before their rows go
+        EntryDraft.all_objects.filter(approvers=instance).update(approval_count=F("approval_count") - 1)
+    elif action == "post_clear" and not reverse:
+        EntryDraft.all_objects.filter(pk=instance.pk).update(approval_count=0)
+        instance.approval_count = 0
+
+
+@receiver(m2m_changed, sender=EntryDraft.approvers.through)
+def notify_draft_approved(*args, instance, action, reverse, pk_set, **kwargs):
     """Notify draft author when draft is approved"""
-    if action == "post_add":
-        # Check if draft just became approved (has enough approvals now)
-        from django.conf import settings
+    # The stored count is already updated, so approvals short of MIN_APPROVALS need no queries
+    if action == "post_add" and pk_set and not reverse and instance.approval_count >= settings.MIN_APPROVALS:
         from django.contrib.auth.models import User
 
-        approver_ids = pk_set
-        if approver_ids and instance.approvers.count() >= settings.MIN_APPROVALS:
-            # Check if notification already exists (to avoid duplicates when adding multiple approvers)
-            if not Notification.objects.filter(
-                user=instance.author,
-                type="draft_approved",
-                related_draft=instance,
-            ).exists():
-                # Draft just became approved
-                approvers = User.objects.filter(id__in=approver_ids)
-                approver_names = ", ".join([approver.get_full_name() or approver.username for approver in approvers])
-                Notification.objects.create(
-                    user=instance.author,
-                    type="draft_approved",
-                    message=f"Your draft for '{instance.entry.term.text}' was approved by {approver_names}",
-                    related_draft=instance,
-                )
+        create_draft_approved_notifications({instance: User.objects.filter(id__in=pk_set)})
 
 
 @receiver(post_save, sender=Comment)
@@ -114,23 +182,22 @@ def notify_comment_mentions_and_replies(*args, instance, created, **kwargs):
 
 
 @receiver(m2m_changed, sender=EntryDraft.requested_reviewers.through)
-def notify_review_requested(*args, instance, action, pk_set, **kwargs):
+def notify_review_requested(*args, instance, action, reverse, pk_set, **kwargs):
     """Notify users when they are requested to review a draft"""
-    if action == "post_add":
-        from django.contrib.auth.models import User
-
-        reviewer_ids = pk_set
-        reviewers = User.objects.filter(id__in=reviewer_ids)
-        for reviewer in reviewers:
-            # Don't notify if reviewer is the author
-            if reviewer != instance.author:
-                Notification.objects.create(
-                    user=reviewer,
-                    type="review_requested",
-                    message=(
-                        f"You were requested to review a draft for "
-                        f"'{instance.entry.term.text}' by "
-                        f"{instance.author.get_full_name() or instance.author.username}"
-                    ),
-                    related_draft=instance,
-                )
+    if action == "post_add" and pk_set and not reverse:
+        # pk_set already holds the reviewer ids, so the author is excluded without loading any users
+        reviewer_ids = sorted(pk_set - {instance.author_id})
+        if not reviewer_ids:
+            return
+
+        message = (
+            f"You were requested to review a draft for "
+            f"'{instance.entry.term.text}' by "
+            f"{instance.author.get_full_name() or instance.author.username}"
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(user_id=reviewer_id, type="review_requested", message=message, related_draft=instance)
+                for reviewer_id in reviewer_ids
+            ]
+        )
@@ -18,6 +18,12 @@ from glossary.models import (
 fake = Faker()
 
 
+@pytest.fixture(autouse=True)
+def fast_password_hasher(settings):
+    """Hash test passwords with MD5; the default PBKDF2 hasher dominates user setup time"""
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
 @pytest.fixture
 def api_client():
     """Fixture for API client"""
@@ -0,0 +1,416 @@
+import csv
+
+import pytest
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, set_script_prefix
+
+from glossary.admin import RECENT_DRAFTS_INLINE_LIMIT, _changelist_url, _upload_url
+from glossary.models import Comment, Entry, EntryDraft, Notification, Perspective, Reaction
+from glossary.tests.conftest import (
+    CommentFactory,
+    EntryDraftFactory,
+    EntryFactory,
+    PerspectiveCuratorFactory,
+    PerspectiveFactory,
+    UserFactory,
+)
+
+
+def make_csv_upload(rows, name="entries.csv"):
+    """Build an uploaded CSV file from a list of row strings"""
+    content = "\n".join(["perspective,term,definition,author", *rows]) + "\n"
+    return SimpleUploadedFile(name, content.encode("utf-8"), content_type="text/csv")
+
+
+def count_changelist_queries(client, url):
+    """Render a changelist and return the number of queries it issued"""
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+def create_admin_rows():
+    """Create one related row for every admin changelist"""
+    draft = EntryDraftFactory(entry=EntryFactory())
+    comment = CommentFactory(draft=draft, parent=CommentFactory(draft=draft))
+    Reaction.objects.create(comment=comment, user=UserFactory())
+    draft.approvers.add(UserFactory(), UserFactory())  # Creates a notification
+    PerspectiveCuratorFactory()
+
+
+@pytest.fixture
+def superuser_client():
+    """Fixture for Django test client logged in as a superuser"""
+    user = UserFactory(is_staff=True, is_superuser=True)
+    client = Client()
+    client.force_login(user)
+    client.user = user
+    return client
+
+
+@pytest.mark.django_db
+class TestCSVUploadAdminView:
+    """Test the CSV upload view registered on EntryAdmin"""
+
+    def test_upload_page_renders_for_superuser(self, superuser_client):
+        """Test that superusers can open the upload form"""
+        response = superuser_client.get(reverse("admin:glossary_entry_upload_csv"))
+        assert response.status_code == 200
+        assert b"Upload CSV File" in response.content
+
+    def test_upload_page_redirects_non_superuser(self):
+        """Test that staff without superuser status are sent back to the changelist"""
+        client = Client()
+        client.force_login(UserFactory(is_staff=True))
+        response = client.get(reverse("admin:glossary_entry_upload_csv"))
+        assert response.status_code == 302
+        assert response.url == reverse("admin:glossary_entry_changelist")
+
+    def test_admin_urls_follow_script_prefix(self):
+        """Test that the redirect URLs pick up a script prefix set after they were first built"""
+        assert _changelist_url() == "/admin/glossary/entry/"
+
+        set_script_prefix("/glossary/")
+        try:
+            assert _changelist_url() == "/glossary/admin/glossary/entry/"
+            assert _upload_url() == "/glossary/admin/glossary/entry/upload-csv/"
+        finally:
+            set_script_prefix("/")
+
+    def test_changelist_links_to_upload_page(self, superuser_client):
+        """Test that the Entry changelist links to the upload view"""
+        response = superuser_client.get(reverse("admin:glossary_entry_changelist"))
+        assert response.status_code == 200
+        assert reverse("admin:glossary_entry_upload_csv").encode() in response.content
+
+    def test_upload_creates_entries_and_published_drafts(self, superuser_client):
+        """Test that uploading a CSV creates entries with published drafts"""
+        csv_file = make_csv_upload(
+            [
+                "Finance,Ledger,A record of accounts,",
+                'Finance,Asset,"Something of value, owned",',
+            ]
+        )
+        response = superuser_client.post(
+            reverse("admin:glossary_entry_upload_csv"),
+            {"csv_file": csv_file, "skip_duplicates": "on"},
+        )
+
+        assert response.status_code == 302
+        assert Entry.objects.count() == 2
+        assert EntryDraft.objects.filter(is_published=True).count() == 2
+        draft = EntryDraft.objects.get(entry__term__text="Asset")
+        assert draft.content == "<p>Something of value, owned</p>"
+
+    def test_upload_reports_first_errors_and_total(self, superuser_client):
+        """Test that only the first row errors are listed, with a count of the rest"""
+        csv_file = make_csv_upload(["Finance,,Missing term,"] * 13 + ["Finance,Ledger,A record of accounts,"])
+        response = superuser_client.post(
+            reverse("admin:glossary_entry_upload_csv"),
+            {"csv_file": csv_file},
+            follow=True,
+        )
+
+        assert response.status_code == 200
+        assert b"Row 2:" in response.content
+        assert b"Row 11:" in response.content
+        assert b"Row 12:" not in response.content
+        assert b"... and 3 more errors." in response.content
+        assert Entry.objects.count() == 1
+
+    @pytest.mark.parametrize(
+        "content,message",
+        [
+            (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", b"does not appear to be a text CSV file"),
+            ("perspective,term,definition\nFinance,Caf\u00e9,Coffee\n".encode("latin-1"), b"must be UTF-8 encoded"),
+            (b"just some notes\nwithout any columns\n", b"does not appear to be comma-separated"),
+        ],
+    )
+    def test_upload_rejects_non_csv_content(self, superuser_client, content, message):
+        """Test that files with a .csv name but non-CSV content are rejected before loading"""
+        csv_file = SimpleUploadedFile("entries.csv", content, content_type="text/csv")
+        response = superuser_client.post(
+            reverse("admin:glossary_entry_upload_csv"),
+            {"csv_file": csv_file},
+            follow=True,
+        )
+
+        assert response.status_code == 200
+        assert message in response.content
+        assert not Entry.objects.exists()
+
+
+@pytest.mark.django_db
+class TestAdminActions:
+    """Test the custom bulk admin actions"""
+
+    def test_soft_delete_selected(self, superuser_client):
+        """Test that soft delete flags all selected rows in one action"""
+        perspectives = PerspectiveFactory.create_batch(3)
+        selected = [p.pk for p in perspectives[:2]]
+
+        response = superuser_client.post(
+            reverse("admin:glossary_perspective_changelist"),
+            {"action": "soft_delete_selected", "_selected_action": selected},
+            follow=True,
+        )
+
+        assert response.status_code == 200
+        assert b"Soft deleted 2 items." in response.content
+        deleted = Perspective.all_objects.filter(pk__in=selected)
+        assert all(p.is_deleted for p in deleted)
+        assert all(p.updated_by == superuser_client.user for p in deleted)
+        assert Perspective.objects.filter(pk=perspectives[2].pk).exists()
+
+    def test_deleted_filter_lists_and_restores_deleted_rows(self, superuser_client):
+        """Test that filtering on is_deleted shows soft-deleted rows so they can be undeleted"""
+        live = PerspectiveFactory(name="Live")
+        deleted = PerspectiveFactory(name="Gone")
+        deleted.delete()
+        url = reverse("admin:glossary_perspective_changelist") + "?is_deleted__exact=1"
+
+        response = superuser_client.get(url)
+        assert response.status_code == 200
+        assert list(response.context["cl"].result_list) == [deleted]
+        assert b"Live" not in response.content
+
+        response = superuser_client.post(
+            url,
+            {"action": "undelete_selected", "_selected_action": [deleted.pk]},
+            follow=True,
+        )
+        assert b"Restored 1 items." in response.content
+        assert set(Perspective.objects.all()) == {live, deleted}
+
+    def test_undelete_skips_rows_that_conflict_with_live_rows(self, superuser_client):
+        """Test that undelete leaves a row deleted when a live row already holds its name"""
+        conflicting = PerspectiveFactory(name="Finance")
+        conflicting.delete()
+        free = PerspectiveFactory(name="Legal")
+        free.delete()
+        live = PerspectiveFactory(name="Finance")
+
+        response = superuser_client.post(
+            reverse("admin:glossary_perspective_changelist") + "?is_deleted__exact=1",
+            {"action": "undelete_selected", "_selected_action": [conflicting.pk, free.pk]},
+            follow=True,
+        )
+
+        assert response.status_code == 200
+        assert b"Restored 1 items." in response.content
+        assert b"Skipped 1 items because a live item with the same values already exists." in response.content
+        assert set(Perspective.objects.all()) == {live, free}
+
+    def test_undelete_restores_only_one_of_duplicate_deleted_rows(self, superuser_client):
+        """Test that two deleted rows with the same key are not both brought back"""
+        first = EntryFactory()
+        first.delete()
+        second = EntryFactory(term=first.term, perspective=first.perspective)
+        second.delete()
+
+        response = superuser_client.post(
+            reverse("admin:glossary_entry_changelist") + "?is_deleted__exact=1",
+            {"action": "undelete_selected", "_selected_action": [first.pk, second.pk]},
+            follow=True,
+        )
+
+        assert response.status_code == 200
+        assert list(Entry.objects.all()) == [first]
+
+    def test_changelist_lists_live_rows_by_default_and_all_on_request(self, superuser_client):
+        """Test that the changelist hides soft-deleted rows unless the "All" choice is picked"""
+        live = PerspectiveFactory(name="Live")
+        deleted = PerspectiveFactory(name="Gone")
+        deleted.delete()
+        url = reverse("admin:glossary_perspective_changelist")
+
+        response = superuser_client.get(url)
+        assert list(response.context["cl"].result_list) == [live]
+
+        response = superuser_client.get(url + "?is_deleted__exact=all")
+        assert set(response.context["cl"].result_list) == {live, deleted}
+
+    def test_change_view_opens_soft_deleted_row(self, superuser_client):
+        """Test that a soft-deleted object can still be opened in the admin"""
+        deleted = PerspectiveFactory(name="Gone")
+        deleted.delete()
+
+        response = superuser_client.get(reverse("admin:glossary_perspective_change", args=[deleted.pk]))
+
+        assert response.status_code == 200
+        assert response.context["original"] == deleted
+
+    def test_export_csv_selected(self, superuser_client):
+        """Test that the export action streams the selected entries as CSV"""
+        entries = [EntryFactory(is_official=True), EntryFactory()]
+        unselected = EntryFactory()
+
+        response = superuser_client.post(
+            reverse("admin:glossary_entry_changelist"),
+            {"action": "export_csv_selected", "_selected_action": [e.pk for e in entries]},
+        )
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Disposition"] == 'attachment; filename="entries.csv"'
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        assert rows[0] == ["term", "perspective", "is_official", "created_at"]
+        assert sorted(row[:3] for row in rows[1:]) == sorted(
+            [e.term.text, e.perspective.name, str(e.is_official)] for e in entries
+        )
+        assert unselected.term.text not in {row[0] for row in rows}
+
+    def test_bulk_approve_drafts(self, superuser_client):
+        """Test bulk approval skips own/already-approved drafts and notifies on full approval"""
+        admin_user = superuser_client.user
+        other_approver = UserFactory()
+        ready = EntryDraftFactory()
+        ready.approvers.add(other_approver)
+        ready.requested_reviewers.add(admin_user)
+        pending = EntryDraftFactory()
+        own = EntryDraftFactory(author=admin_user)
+        already = EntryDraftFactory()
+        already.approvers.add(admin_user)
+
+        response = superuser_client.post(
+            reverse("admin:glossary_entrydraft_changelist"),
+            {
+                "action": "bulk_approve_drafts",
+                "_selected_action": [ready.pk, pending.pk, own.pk, already.pk],
+            },
+            follow=True,
+        )
+
+        assert response.status_code == 200
+        assert b"Approved 2 drafts." in response.content
+        assert f"Could not approve draft {own.pk}".encode() in response.content
+        assert f"Could not approve draft {already.pk}".encode() in response.content
+        assert set(ready.approvers.all()) == {other_approver, admin_user}
+        assert list(pending.approvers.all()) == [admin_user]
+        assert not own.approvers.exists()
+        assert not ready.requested_reviewers.exists()
+        ready.refresh_from_db()
+        assert ready.approval_count == 2
+
+        notifications = Notification.objects.filter(type="draft_approved")
+        assert [n.related_draft for n in notifications] == [ready]
+        assert notifications[0].user == ready.author
+
+
+@pytest.mark.django_db
+class TestChangelistQueries:
+    """Test that changelist query counts do not grow with the number of rows"""
+
+    @pytest.mark.parametrize(
+        "model_name",
+        ["entry", "entrydraft", "comment", "perspectivecurator", "userprofile", "reaction", "notification"],
+    )
+    def test_changelist_query_count_is_constant(self, superuser_client, model_name):
+        url = reverse(f"admin:glossary_{model_name}_changelist")
+        create_admin_rows()
+        baseline = count_changelist_queries(superuser_client, url)
+
+        for _ in range(3):
+            create_admin_rows()
+
+        assert count_changelist_queries(superuser_client, url) == baseline
+
+
+@pytest.mark.django_db
+class TestChangelistTextPreviews:
+    """Test that long text columns are truncated for changelists"""
+
+    def test_long_description_is_truncated(self, superuser_client):
+        PerspectiveFactory(name="Long", description="x" * 80)
+        PerspectiveFactory(name="Short", description="y" * 50)
+
+        response = superuser_client.get(reverse("admin:glossary_perspective_changelist"))
+
+        assert response.status_code == 200
+        assert ("x" * 50 + "...").encode() in response.content
+        assert ("x" * 51).encode() not in response.content
+        assert ("y" * 50 + "...").encode() not in response.content
+
+    @pytest.mark.parametrize(
+        "model_name,field",
+        [("perspective", "description"), ("entrydraft", "content"), ("comment", "text"), ("notification", "message")],
+    )
+    def test_changelist_defers_full_text(self, superuser_client, model_name, field):
+        create_admin_rows()
+
+        response = superuser_client.get(reverse(f"admin:glossary_{model_name}_changelist"))
+
+        assert response.status_code == 200
+        assert all(field in obj.get_deferred_fields() for obj in response.context["cl"].result_list)
+
+    def test_change_view_loads_full_text(self, superuser_client):
+        perspective = PerspectiveFactory(description="x" * 80)
+
+        response = superuser_client.get(reverse("admin:glossary_perspective_change", args=[perspective.pk]))
+
+        assert response.status_code == 200
+        assert response.context["original"].get_deferred_fields() == set()
+
+
+@pytest.mark.django_db
+class TestEntryDraftInline:
+    """Test the drafts inline on the Entry change page"""
+
+    def test_entry_change_view_shows_annotated_draft_approvals(self, superuser_client):
+        draft = EntryDraftFactory()
+        draft.approvers.add(UserFactory(), UserFactory())
+
+        response = superuser_client.get(reverse("admin:glossary_entry_change", args=[draft.entry_id]))
+
+        assert response.status_code == 200
+        assert b"2 approvals" in response.content
+
+    def test_entry_change_view_query_count_is_constant(self, superuser_client):
+        entry = EntryFactory()
+        EntryDraftFactory(entry=entry)
+        url = reverse("admin:glossary_entry_change", args=[entry.pk])
+        superuser_client.get(url)  # Warm per-process caches such as content types
+        baseline = count_changelist_queries(superuser_client, url)
+
+        EntryDraftFactory.create_batch(3, entry=entry)
+
+        assert count_changelist_queries(superuser_client, url) == baseline
+
+    def test_entry_change_view_limits_inline_to_recent_drafts(self, superuser_client):
+        entry = EntryFactory()
+        drafts = EntryDraftFactory.create_batch(RECENT_DRAFTS_INLINE_LIMIT + 2, entry=entry)
+
+        response = superuser_client.get(reverse("admin:glossary_entry_change", args=[entry.pk]))
+
+        formset = response.context["inline_admin_formsets"][0].formset
+        assert len(formset.forms) == RECENT_DRAFTS_INLINE_LIMIT
+        assert formset.total_form_count() == RECENT_DRAFTS_INLINE_LIMIT
+        assert f"?entry__id__exact={entry.pk}" in response.content.decode()
+
+        all_drafts = superuser_client.get(
+            reverse("admin:glossary_entrydraft_changelist"), {"entry__id__exact": entry.pk}
+        )
+        assert all_drafts.context["cl"].result_count == len(drafts)
+
+
+@pytest.mark.django_db
+class TestChangeViewQueries:
+    """Test that change forms do not load every related row into <select> widgets"""
+
+    @pytest.mark.parametrize("model_name", ["entrydraft", "comment"])
+    def test_change_view_query_count_is_constant(self, superuser_client, model_name):
+        create_admin_rows()
+        obj = {"entrydraft": EntryDraft, "comment": Comment}[model_name].objects.first()
+        url = reverse(f"admin:glossary_{model_name}_change", args=[obj.pk])
+        superuser_client.get(url)  # Warm per-process caches such as content types
+        baseline = count_changelist_queries(superuser_client, url)
+
+        for _ in range(3):
+            create_admin_rows()
+
+        assert count_changelist_queries(superuser_client, url) == baseline
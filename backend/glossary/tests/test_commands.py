@@ -0,0 +1,131 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.db.models import Count
+from django.utils import timezone
+
+from glossary.management.commands.load_test_data import Command as LoadTestDataCommand
+from glossary.management.commands.reset_test_db import Command as ResetTestDbCommand
+from glossary.models import Entry, EntryDraft, Notification
+from glossary.tests.conftest import EntryDraftFactory, PerspectiveCuratorFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestArchiveOldDrafts:
+    """Test the archive_old_drafts management command"""
+
+    def test_archives_old_unpublished_drafts_in_batches(self):
+        old = timezone.now() - timedelta(days=45)
+        stale = EntryDraftFactory.create_batch(5)
+        published = EntryDraftFactory(is_published=True)
+        recent = EntryDraftFactory()
+        EntryDraft.objects.filter(pk__in=[d.pk for d in [*stale, published]]).update(created_at=old)
+
+        out = StringIO()
+        call_command("archive_old_drafts", batch_size=2, stdout=out)
+
+        assert "Successfully archived 5 draft(s)" in out.getvalue()
+        assert set(EntryDraft.objects.filter(is_archived=True)) == set(stale)
+        assert not EntryDraft.objects.filter(pk__in=[published.pk, recent.pk], is_archived=True).exists()
+
+
+def write_csv(path, rows):
+    """Write a load_test_data CSV file from a list of row strings"""
+    path.write_text("\n".join(["perspective,term,definition,author", *rows]) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.django_db
+class TestLoadTestData:
+    """Test the load_test_data management command"""
+
+    AUTHORS = ["Ben Carter", "Aisha Khan", "Sofia Rossi", "Leo Schmidt"]
+
+    def test_loads_entries_and_drafts(self, tmp_path):
+        rows = [f"Physics,Term {i},Definition {i},{self.AUTHORS[i % 4]}" for i in range(12)]
+
+        call_command("load_test_data", csv_path=write_csv(tmp_path / "test_data.csv", rows), stdout=StringIO())
+
+        assert Entry.objects.count() == 12
+        assert not Entry.objects.filter(drafts__isnull=True).exists()
+        published = EntryDraft.objects.filter(is_published=True).annotate(num_approvers=Count("approvers"))
+        assert not published.filter(published_at__isnull=True).exists()
+        assert not published.filter(num_approvers__lt=2).exists()
+        approved = EntryDraft.objects.annotate(num_approvers=Count("approvers")).filter(num_approvers__gte=2)
+        assert Notification.objects.filter(type="draft_approved").count() == approved.count()
+        # Drafts keep the generated timestamps rather than the insert time
+        assert EntryDraft.objects.filter(created_at__lt=timezone.now() - timedelta(days=1)).exists()
+
+    def test_real_data_second_draft_replaces_first(self, tmp_path):
+        rows = [
+            "EES,Layer,One definition,Ben Carter",
+            "EES,Layer,Another definition,Ben Carter",
+            "Tools,Exporter,A tool,Ben Carter",
+        ]
+
+        call_command("load_test_data", csv_path=write_csv(tmp_path / "real_data.csv", rows), stdout=StringIO())
+
+        # Rows are shuffled, so either definition may be loaded first
+        first, second = EntryDraft.objects.filter(entry__term__text="Layer").order_by("created_at")
+        assert second.replaces_draft == first
+        assert second.is_published and not first.is_published
+        assert EntryDraft.objects.get(entry__term__text="Exporter").is_published
+
+    def test_data_quality_metrics(self):
+        curator = PerspectiveCuratorFactory()
+        curated = EntryDraftFactory(entry__perspective=curator.perspective)
+        curated.approvers.add(curator.user, UserFactory())
+        EntryDraftFactory(entry__perspective=curator.perspective).approvers.add(UserFactory())
+        EntryDraftFactory(entry=curated.entry, is_published=True)
+        EntryDraftFactory(is_published=True)
+
+        metrics = LoadTestDataCommand().generate_data_quality_metrics()
+
+        assert metrics["curator_involvement"] == 1
+        assert metrics["total_drafts"] == 4
+        assert metrics["published_drafts"] == 2
+        assert metrics["approval_distribution"] == {
+            "0_approvals": 2,
+            "1_approvals": 1,
+            "2_approvals": 1,
+            "3_approvals": 0,
+        }
+        assert metrics["entries_with_only_unpublished"] == 1
+        assert metrics["entries_with_published"] == 1
+        assert metrics["entries_with_both_states"] == 1
+
+    def test_validation_fixes_inconsistent_revision_chains(self):
+        original = EntryDraftFactory()
+        consistent = EntryDraftFactory(entry=original.entry, replaces_draft=original)
+        inconsistent = EntryDraftFactory(entry=original.entry, replaces_draft=consistent)
+        EntryDraft.objects.filter(pk=inconsistent.pk).update(created_at=consistent.created_at - timedelta(days=1))
+
+        errors = LoadTestDataCommand().validate_data_consistency()
+
+        assert errors == ["Found 1 revision chains with inconsistent created_at (fixed)"]
+        inconsistent.refresh_from_db()
+        assert inconsistent.created_at == consistent.created_at + timedelta(seconds=1)
+
+
+@pytest.mark.django_db
+class TestResetTestDb:
+    """Test the reset_test_db database verification"""
+
+    def test_verify_database_state_reports_live_counts_and_users(self):
+        UserFactory(username="admin")
+        UserFactory(username="bencarter")
+        EntryDraftFactory.create_batch(2)
+        EntryDraftFactory(is_deleted=True)
+
+        command = ResetTestDbCommand(stdout=StringIO())
+        command.verify_database_state()
+        output = command.stdout.getvalue()
+
+        assert "Drafts: 2" in output
+        assert "Entries: 3" in output
+        assert "Admin user exists" in output
+        assert "Test user bencarter exists" in output
+        assert "Test user mariacarter not found" in output
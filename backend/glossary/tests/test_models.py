@@ -1,10 +1,13 @@
 import pytest
 
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
 
 from glossary.models import (
     EntryDraft,
     Perspective,
+    Term,
 )
 from glossary.tests.conftest import (
     CommentFactory,
@@ -31,6 +34,18 @@ class TestAuditedModelAndSoftDelete:
         assert Perspective.all_objects.count() == 1
         assert perspective.is_deleted is True
 
+    def test_soft_delete_writes_only_the_flag(self):
+        """Test that soft delete updates is_deleted/updated_at without rewriting the other columns"""
+        draft = EntryDraftFactory()
+
+        with CaptureQueriesContext(connection) as context:
+            draft.delete()
+
+        (update,) = [query["sql"] for query in context.captured_queries if query["sql"].startswith("UPDATE")]
+        assert '"is_deleted"' in update
+        assert '"content"' not in update
+        assert EntryDraft.all_objects.get(pk=draft.pk).is_deleted is True
+
     def test_hard_delete_actually_deletes(self):
         """Test that hard_delete removes object from database"""
         perspective = PerspectiveFactory()
@@ -39,6 +54,16 @@ class TestAuditedModelAndSoftDelete:
         perspective.hard_delete()
         assert Perspective.all_objects.count() == 0
 
+    def test_related_managers_exclude_soft_deleted(self):
+        """Test that reverse relations use the soft-delete manager while forward relations still resolve"""
+        entry = EntryFactory()
+        live = EntryDraftFactory(entry=entry)
+        deleted = EntryDraftFactory(entry=entry)
+        deleted.delete()
+
+        assert list(entry.drafts.all()) == [live]
+        assert EntryDraft.all_objects.get(pk=deleted.pk).entry == entry
+
     def test_audit_fields_are_set(self):
         """Test that audit fields are automatically populated"""
         user = UserFactory()
@@ -48,6 +73,20 @@ class TestAuditedModelAndSoftDelete:
         assert perspective.updated_at is not None
         assert perspective.created_by == user
 
+    def test_full_clean_skips_lookup_for_loaded_foreign_keys(self):
+        """Test that a loaded related object is not re-fetched to validate its foreign key"""
+        user = UserFactory()
+
+        with CaptureQueriesContext(connection) as context:
+            Term.objects.create(text="Ledger", created_by=user)
+
+        assert not any('FROM "auth_user"' in query["sql"] for query in context.captured_queries)
+
+    def test_full_clean_still_rejects_missing_foreign_keys(self):
+        """Test that a foreign key set by id is still validated"""
+        with pytest.raises(ValidationError):
+            Term.objects.create(text="Ledger", created_by_id=999999)
+
 
 @pytest.mark.django_db
 class TestPerspectiveModel:
@@ -62,9 +101,11 @@ class TestPerspectiveModel:
         """Test that perspective names must be unique among non-deleted records"""
         PerspectiveFactory(name="Finance")
 
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError) as excinfo:
             PerspectiveFactory(name="Finance")
 
+        assert list(excinfo.value.message_dict) == ["name"]
+
     def test_perspective_can_reuse_deleted_name(self):
         """Test that we can create a perspective with same name as soft-deleted one"""
         perspective1 = PerspectiveFactory(name="Finance")
@@ -93,9 +134,22 @@ class TestTermModel:
         """Test that term text must be unique among non-deleted records"""
         TermFactory(text="API")
 
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError) as excinfo:
             TermFactory(text="API")
 
+        assert list(excinfo.value.message_dict) == ["text"]
+
+    def test_term_uniqueness_enforced_by_database(self):
+        """Test that writes bypassing full_clean() cannot duplicate a live term"""
+        term = TermFactory(text="API")
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            Term.objects.bulk_create([Term(text="API", text_normalized="api")])
+
+        term.delete()
+        Term.objects.bulk_create([Term(text="API", text_normalized="api")])
+        assert Term.objects.filter(text="API").count() == 1
+
     def test_term_is_official_flag(self):
         """Test the is_official flag"""
         term = TermFactory(is_official=True)
@@ -155,6 +209,53 @@ class TestEntryDraftModel:
         version.approvers.add(user1)
         assert version.approval_count == 1
 
+    def test_approval_count_follows_approver_changes(self):
+        """Test that the stored approval_count tracks adds, removes and clears from either side"""
+        version = EntryDraftFactory()
+        user1, user2 = UserFactory(), UserFactory()
+
+        version.approvers.add(user1, user2)
+        version.approvers.remove(user1)
+        assert version.approval_count == 1
+
+        user1.approved_drafts.add(version)
+        version.refresh_from_db()
+        assert version.approval_count == 2
+
+        user2.approved_drafts.clear()
+        version.refresh_from_db()
+        assert version.approval_count == 1
+
+        version.approvers.clear()
+        assert version.approval_count == 0
+        version.refresh_from_db()
+        assert version.approval_count == 0
+
+    def test_save_of_stale_instance_keeps_approval_count(self):
+        """Test that saving an instance loaded before approvals were added leaves the stored count alone"""
+        version = EntryDraftFactory()
+        stale = EntryDraft.objects.get(pk=version.pk)
+        version.approvers.add(UserFactory(), UserFactory())
+
+        stale.save()
+
+        stale.refresh_from_db()
+        assert stale.approval_count == 2
+        assert stale.is_approved is True
+
+    def test_content_edit_on_stale_instance_clears_approvals(self):
+        """Test that editing content clears approvals even when the instance has not seen them"""
+        version = EntryDraftFactory(content="<p>Old</p>")
+        stale = EntryDraft.objects.get(pk=version.pk)
+        version.approvers.add(UserFactory())
+
+        stale.content = "<p>New</p>"
+        stale.save()
+
+        stale.refresh_from_db()
+        assert stale.approval_count == 0
+        assert not stale.approvers.exists()
+
     def test_is_approved_property(self):
         """Test the is_approved property (requires MIN_APPROVALS=2)"""
         version = EntryDraftFactory()
@@ -168,6 +269,33 @@ class TestEntryDraftModel:
         version.approvers.add(user2)
         assert version.is_approved is True
 
+    def test_save_clears_approvals_without_refetching_loaded_draft(self):
+        """Test that a content edit on a loaded draft clears approvals without re-reading the draft row"""
+        version = EntryDraftFactory(content="<p>Old</p>")
+        version.approvers.add(UserFactory())
+        version = EntryDraft.objects.get(pk=version.pk)
+
+        version.content = "<p>New</p>"
+        with CaptureQueriesContext(connection) as context:
+            version.save()
+
+        assert not any(
+            query["sql"].startswith("SELECT") and 'FROM "glossary_entry_draft"' in query["sql"]
+            for query in context.captured_queries
+        )
+        assert version.approval_count == 0
+        assert not version.approvers.exists()
+
+    def test_clear_approvals_discards_prefetched_approvers(self):
+        """Test that clear_approvals() leaves no stale prefetched approvers behind"""
+        version = EntryDraftFactory()
+        version.approvers.add(UserFactory())
+        version = EntryDraft.objects.prefetch_related("approvers").get(pk=version.pk)
+
+        version.clear_approvals()
+
+        assert list(version.approvers.all()) == []
+
     def test_approve_method_adds_approver(self):
         """Test the approve() method"""
         author = UserFactory()
@@ -7,6 +7,8 @@ from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from glossary.models import Comment, Notification
@@ -179,6 +181,16 @@ class TestNotificationSignals:
         notifications = Notification.objects.filter(user=author, type="draft_approved", related_draft=draft)
         assert notifications.count() == 1
 
+    def test_notify_draft_approved_signal_skips_queries_below_min_approvals(self):
+        """Test that an approval short of MIN_APPROVALS does not look for drafts to notify about"""
+        draft = EntryDraftFactory(is_published=False)
+        approver = UserFactory()
+
+        with CaptureQueriesContext(connection) as context:
+            draft.approvers.add(approver)
+
+        assert not any("glossary_notification" in query["sql"] for query in context.captured_queries)
+
     def test_notify_comment_reply_signal(self):
         """Test notification when someone replies to a comment"""
         comment_author = UserFactory()
@@ -287,6 +299,18 @@ class TestNotificationSignals:
         notification = notifications.first()
         assert "requested to review" in notification.message.lower()
 
+    def test_notify_review_requested_signal_batches_reviewers(self):
+        """Test that requesting several reviewers at once notifies each of them with one insert"""
+        draft = EntryDraftFactory(is_published=False)
+        reviewers = [UserFactory() for _ in range(3)]
+
+        with CaptureQueriesContext(connection) as context:
+            draft.requested_reviewers.set(reviewers)
+
+        notified = Notification.objects.filter(type="review_requested", related_draft=draft)
+        assert set(notified.values_list("user", flat=True)) == {reviewer.pk for reviewer in reviewers}
+        assert sum('INSERT INTO "glossary_notification"' in query["sql"] for query in context.captured_queries) == 1
+
     def test_notify_review_requested_author_excluded(self):
         """Test that requesting author as reviewer doesn't create notification"""
         author = UserFactory()
@@ -0,0 +1,106 @@
+import io
+
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from glossary.models import Entry, EntryDraft, Notification, Term
+from glossary.tests.conftest import EntryDraftFactory, EntryFactory, UserFactory
+from glossary.utils import load_entries_from_csv
+
+
+def make_csv(rows):
+    """Build an in-memory CSV file from a list of row strings"""
+    content = "\n".join(["perspective,term,definition,author", *rows]) + "\n"
+    return io.BytesIO(content.encode("utf-8"))
+
+
+@pytest.fixture
+def admin_user():
+    return UserFactory(is_staff=True, is_superuser=True)
+
+
+@pytest.mark.django_db
+class TestLoadEntriesFromCSV:
+    """Test the batched CSV loader"""
+
+    def test_creates_terms_entries_and_published_drafts(self, admin_user):
+        author = UserFactory(username="jdoe")
+        summary = load_entries_from_csv(
+            make_csv(["Finance,Ledger,A record of accounts,jdoe", "Finance,Asset,Something of value,"]),
+            admin_user,
+        )
+
+        assert summary["entries_created"] == 2
+        assert summary["drafts_created"] == 2
+        assert summary["errors"] == []
+        assert Term.objects.get(text="Asset").text_normalized == "asset"
+
+        draft = EntryDraft.objects.get(entry__term__text="Ledger")
+        assert draft.is_published
+        assert draft.published_at is not None
+        assert draft.author == author
+        assert set(draft.approvers.all()) == {admin_user, author}
+        assert Notification.objects.filter(type="draft_approved", related_draft=draft, user=author).exists()
+
+    def test_admin_authored_draft_is_approved_by_other_staff(self, admin_user):
+        staff = UserFactory(is_staff=True)
+        load_entries_from_csv(make_csv(["Finance,Ledger,A record of accounts,"]), admin_user)
+
+        draft = EntryDraft.objects.get()
+        assert draft.author == admin_user
+        assert set(draft.approvers.all()) == {admin_user, staff}
+
+    def test_skips_matching_content_and_chains_replaced_drafts(self, admin_user):
+        entry = EntryFactory(term__text="Ledger", perspective__name="Finance")
+        existing = EntryDraftFactory(entry=entry, content="<p>Old</p>", is_published=True)
+
+        summary = load_entries_from_csv(
+            make_csv(
+                [
+                    "Finance,Ledger,Old,",
+                    "Finance,Ledger,New,",
+                    "Finance,Ledger,Newer,",
+                ]
+            ),
+            admin_user,
+        )
+
+        assert summary["entries_created"] == 0
+        assert summary["skipped"] == 1
+        assert summary["drafts_created"] == 2
+        new = EntryDraft.objects.get(content="<p>New</p>")
+        newer = EntryDraft.objects.get(content="<p>Newer</p>")
+        assert new.replaces_draft == existing
+        assert newer.replaces_draft == new
+
+    def test_reports_invalid_rows_in_order(self, admin_user):
+        summary = load_entries_from_csv(
+            make_csv([",Ledger,No perspective,", "Finance,,No term,", "Finance,Asset,Valid,"]),
+            admin_user,
+        )
+
+        assert summary["errors_total"] == 2
+        assert [error.split(":")[0] for error in summary["errors"]] == ["Row 2", "Row 3"]
+        assert list(Entry.objects.values_list("term__text", flat=True)) == ["Asset"]
+
+    def test_resolves_cross_references(self, admin_user):
+        summary = load_entries_from_csv(
+            make_csv(["Finance,Ledger,See [[Asset|Finance]],", "Finance,Asset,Something of value,"]),
+            admin_user,
+        )
+
+        asset = Entry.objects.get(term__text="Asset")
+        assert summary["cross_references_resolved"] == 1
+        assert f'data-entry-id="{asset.pk}"' in EntryDraft.objects.get(entry__term__text="Ledger").content
+
+    def test_query_count_does_not_grow_with_rows(self, admin_user):
+        def count_queries(rows):
+            with CaptureQueriesContext(connection) as context:
+                load_entries_from_csv(make_csv(rows), admin_user)
+            return len(context.captured_queries)
+
+        count_queries(["Finance,Ledger,A record of accounts,"])  # Creates the perspective
+        baseline = count_queries([f"Finance,Term {i},Definition {i}," for i in range(2)])
+        assert count_queries([f"Finance,Word {i},Definition {i}," for i in range(20)]) == baseline
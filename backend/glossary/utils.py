@@ -5,12 +5,25 @@ Utility functions for CSV processing and glossary data loading.
 import csv
 import re
 from io import TextIOWrapper
+from itertools import islice
 
+from unidecode import unidecode
+
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 
-from glossary.models import Entry, EntryDraft, Perspective, Term
+from glossary.models import Entry, EntryDraft, EntryDraftApprover, Perspective, Term
+from glossary.signals import create_draft_approved_notifications
+
+# Number of CSV rows read from the file at a time during upload processing
+CSV_BATCH_SIZE = 500
+
+# Row errors kept in the upload summary; the rest are only counted in errors_total
+MAX_REPORTED_CSV_ERRORS = 10
 
 
 def normalize_content(content):
@@ -26,50 +39,11 @@ def normalize_content(content):
     return content
 
 
-def resolve_author(author_name, admin_user):
-    """
-    Resolve author from CSV row.
-
-    Args:
-        author_name: Author name from CSV (may be None, empty, or username)
-        admin_user: Admin user to use as fallback
-
-    Returns:
-        User object to use as author
-    """
-    if not author_name or not author_name.strip():
-        return admin_user
-
-    # Try to find user by username
-    try:
-        user = User.objects.get(username=author_name.strip())
-        return user
-    except User.DoesNotExist:
-        # If user doesn't exist, use admin user
-        return admin_user
-
-
-def get_latest_published_draft(entry):
-    """Get the latest published draft for an entry."""
-    return entry.drafts.filter(is_published=True, is_deleted=False).order_by("-published_at", "-created_at").first()
-
-
 def content_matches(existing_content, new_content):
     """Check if two content strings match after normalization."""
     return normalize_content(existing_content) == normalize_content(new_content)
 
 
-def _get_or_create_perspective(perspective_name, admin_user, perspectives_cache=None):
-    """Get or create perspective, using cache if available."""
-    if perspectives_cache and perspective_name in perspectives_cache:
-        return perspectives_cache[perspective_name]
-
-    perspective, _ = Perspective.objects.get_or_create(name=perspective_name, defaults={"created_by": admin_user})
-    if perspectives_cache:
-        perspectives_cache[perspective_name] = perspective
-    return perspective
-
-
 def _prepare_content(definition):
     """Prepare content, wrapping in <p> tags if needed."""
     content = definition.strip()
@@ -78,98 +52,136 @@ def _prepare_content(definition):
     return content
 
 
-def _add_approvers_for_admin_upload(draft, admin_user, author):
-    """Add approvers to meet MIN_APPROVALS requirement for admin uploads."""
-    from django.conf import settings
-
-    min_approvals = getattr(settings, "MIN_APPROVALS", 2)
-    draft.approvers.add(admin_user)
-
-    if min_approvals > 1 and author != admin_user:
-        draft.approvers.add(author)
-
-    if draft.approvers.count() < min_approvals:
-        other_staff = (
-            User.objects.filter(is_staff=True, is_active=True)
-            .exclude(id=admin_user.id)
-            .exclude(id__in=draft.approvers.values_list("id", flat=True))
-            .first()
-        )
-        if other_staff:
-            draft.approvers.add(other_staff)
-
-
-def _create_and_publish_draft(entry, content, author, admin_user, published_draft):
-    """Create a new draft, approve it, and publish it."""
-    draft = EntryDraft.objects.create(entry=entry, content=content, author=author, created_by=admin_user)
-
-    _add_approvers_for_admin_upload(draft, admin_user, author)
-
-    draft.is_published = True
-    draft.published_at = timezone.now()
-
-    if published_draft:
-        draft.replaces_draft = published_draft
-
-    draft.save()
-    return draft
-
-
-def process_csv_row(row, admin_user, perspectives_cache=None):
-    """
-    Process a single CSV row and create/update entry draft.
-
-    Args:
-        row: Dictionary with keys: perspective, term, definition, author (optional)
-        admin_user: Admin user for fallback author and created_by
-        perspectives_cache: Optional dict to cache perspectives
-
-    Returns:
-        dict with keys: entry_created, draft_created, skipped, error
-    """
-    result = {
-        "entry_created": False,
-        "draft_created": False,
-        "skipped": False,
-        "error": None,
+def _parse_csv_row(row):
+    """Extract the cleaned perspective, term, author and content from a CSV row."""
+    return {
+        "perspective": row["perspective"].strip(),
+        "term": row["term"].strip(),
+        "author": (row.get("author") or "").strip(),
+        "content": _prepare_content(row["definition"]),
     }
 
-    try:
-        perspective = _get_or_create_perspective(row["perspective"].strip(), admin_user, perspectives_cache)
-
-        term_text = row["term"].strip()
-        term, _ = Term.objects.get_or_create(text=term_text, defaults={"created_by": admin_user})
 
-        entry, entry_created = Entry.objects.get_or_create(
-            term=term, perspective=perspective, defaults={"created_by": admin_user}
-        )
-        result["entry_created"] = entry_created
+def _load_perspectives(names, admin_user, perspectives_cache):
+    """Get or create perspectives missing from the cache. Returns {name: error} for invalid names."""
+    errors = {}
+    for name in names - perspectives_cache.keys():
+        try:
+            perspectives_cache[name], _ = Perspective.objects.get_or_create(
+                name=name, defaults={"created_by": admin_user}
+            )
+        except Exception as e:
+            errors[name] = str(e)
+    return errors
+
+
+def _load_terms(texts, admin_user):
+    """Fetch terms by text and bulk create missing ones. Returns ({text: term}, {text: error})."""
+    terms = {}
+    for term in Term.objects.filter(text__in=texts):
+        terms.setdefault(term.text, term)
+
+    new_terms, errors = [], {}
+    for text in texts - terms.keys():
+        term = Term(text=text, text_normalized=unidecode(text.lower()), created_by=admin_user)
+        try:
+            # Uniqueness was settled by the lookup above, so only field validation is needed
+            term.clean_fields(exclude=["created_by", "updated_by"])
+        except ValidationError as e:
+            errors[text] = str(e)
+            continue
+        new_terms.append(term)
+
+    for term in Term.objects.bulk_create(new_terms):
+        terms[term.text] = term
+    return terms, errors
+
+
+def _load_entries(pairs, admin_user):
+    """Fetch entries by (term, perspective) and bulk create missing ones.
+
+    Returns ({(term_id, perspective_id): entry}, set of keys whose entry was created).
+    """
+    entries = {}
+    existing = Entry.objects.filter(
+        term__in={term for term, _ in pairs}, perspective__in={perspective for _, perspective in pairs}
+    ).select_related("term")
+    for entry in existing:
+        entries.setdefault((entry.term_id, entry.perspective_id), entry)
+
+    new_entries = [
+        Entry(term=term, perspective=perspective, created_by=admin_user)
+        for term, perspective in pairs
+        if (term.pk, perspective.pk) not in entries
+    ]
+    for entry in Entry.objects.bulk_create(new_entries):
+        entries[(entry.term_id, entry.perspective_id)] = entry
+    return entries, {(entry.term_id, entry.perspective_id) for entry in new_entries}
+
+
+def _load_authors(usernames):
+    """Return {username: user} for the CSV author names that match existing users."""
+    if not usernames:
+        return {}
+    return {user.username: user for user in User.objects.filter(username__in=usernames)}
+
+
+def _latest_published_drafts(entry_ids):
+    """Return {entry_id: latest published draft} for the given entries."""
+    latest = (
+        EntryDraft.objects.filter(entry=OuterRef("pk"), is_published=True)
+        .order_by("-published_at", "-created_at")
+        .values("pk")[:1]
+    )
+    latest_ids = dict(
+        Entry.objects.filter(pk__in=entry_ids)
+        .annotate(latest_published_id=Subquery(latest))
+        .filter(latest_published_id__isnull=False)
+        .values_list("pk", "latest_published_id")
+    )
+    drafts = EntryDraft.objects.only("entry_id", "content").in_bulk(latest_ids.values())
+    return {entry_id: drafts[draft_id] for entry_id, draft_id in latest_ids.items()}
+
+
+def _upload_approvers(author, admin_user, staff_candidates):
+    """Approvers granted to an admin-uploaded draft so it meets MIN_APPROVALS."""
+    min_approvals = getattr(settings, "MIN_APPROVALS", 2)
+    approvers = [admin_user]
 
-        author = resolve_author(row.get("author", "").strip() if "author" in row else "", admin_user)
-        content = _prepare_content(row["definition"])
+    if min_approvals > 1 and author != admin_user:
+        approvers.append(author)
 
-        published_draft = get_latest_published_draft(entry)
-        if published_draft and content_matches(published_draft.content, content):
-            result["skipped"] = True
-            return result
+    if len(approvers) < min_approvals:
+        other_staff = next((user for user in staff_candidates if user not in approvers), None)
+        if other_staff:
+            approvers.append(other_staff)
+    return approvers
 
-        _create_and_publish_draft(entry, content, author, admin_user, published_draft)
-        result["draft_created"] = True
 
-    except Exception as e:
-        result["error"] = str(e)
+def _publish_drafts(drafts, admin_user, staff_candidates):
+    """Bulk insert published drafts together with their upload approvals and notifications."""
+    if not drafts:
+        return
 
-    return result
+    approvers = [_upload_approvers(draft.author, admin_user, staff_candidates) for draft in drafts]
+    for draft, users in zip(drafts, approvers):
+        draft.approval_count = len(users)
+    EntryDraft.objects.bulk_create(drafts)
+    approvals = dict(zip(drafts, approvers))
+    EntryDraftApprover.objects.bulk_create(
+        [EntryDraftApprover(entrydraft=draft, user=user) for draft, users in approvals.items() for user in users]
+    )
+    create_draft_approved_notifications(approvals)
 
 
 def _open_csv_file(csv_file):
     """Open CSV file, handling file paths or Django uploaded files. Returns (file_obj, should_close)."""
     if isinstance(csv_file, str):
-        return open(csv_file, "r", encoding="utf-8"), True
+        return open(csv_file, "r", encoding="utf-8", newline=""), True
     elif hasattr(csv_file, "read"):
         if hasattr(csv_file, "seek"):
             csv_file.seek(0)
-        return TextIOWrapper(csv_file, encoding="utf-8"), False
+        return TextIOWrapper(csv_file, encoding="utf-8", newline=""), False
     else:
         raise ValueError("csv_file must be a file path, file object, or Django uploaded file")
 
@@ -182,22 +194,99 @@ def _validate_csv_columns(reader):
         raise ValueError(f"CSV missing required columns: {', '.join(missing)}")
 
 
-def _process_csv_rows(reader, admin_user, summary):
-    """Process all CSV rows and update summary."""
-    perspectives_cache = {}
+def _iter_csv_batches(reader, batch_size=CSV_BATCH_SIZE):
+    """Lazily yield lists of (row_num, row) tuples so only one batch is held in memory."""
+    rows = enumerate(reader, start=2)  # Start at 2 (row 1 is header)
+    while batch := list(islice(rows, batch_size)):
+        yield batch
 
-    for row_num, row in enumerate(reader, start=2):  # Start at 2 (row 1 is header)
-        result = process_csv_row(row, admin_user, perspectives_cache)
 
-        if result["error"]:
-            summary["errors"].append(f"Row {row_num}: {result['error']}")
-        elif result["skipped"]:
-            summary["skipped"] += 1
+def _record_csv_error(summary, row_num, error):
+    """Count a row error, keeping the message only while under MAX_REPORTED_CSV_ERRORS."""
+    summary["errors_total"] += 1
+    if len(summary["errors"]) < MAX_REPORTED_CSV_ERRORS:
+        summary["errors"].append(f"Row {row_num}: {error}")
+
+
+def _process_csv_batch(batch, admin_user, summary, perspectives_cache, staff_candidates):
+    """
+    Process one batch of CSV rows and update summary.
+
+    Perspectives, terms, entries, authors and latest published drafts are looked up
+    with one query each per batch, and new rows are written with bulk_create.
+    """
+    errors = {}
+    parsed = []
+    for row_num, row in batch:
+        try:
+            parsed.append((row_num, _parse_csv_row(row)))
+        except Exception as e:
+            errors[row_num] = str(e)
+
+    perspective_errors = _load_perspectives(
+        {fields["perspective"] for _, fields in parsed}, admin_user, perspectives_cache
+    )
+    terms, term_errors = _load_terms({fields["term"] for _, fields in parsed}, admin_user)
+
+    rows = []
+    for row_num, fields in parsed:
+        error = perspective_errors.get(fields["perspective"]) or term_errors.get(fields["term"])
+        if error:
+            errors[row_num] = error
         else:
-            if result["entry_created"]:
-                summary["entries_created"] += 1
-            if result["draft_created"]:
-                summary["drafts_created"] += 1
+            rows.append((row_num, terms[fields["term"]], perspectives_cache[fields["perspective"]], fields))
+
+    entries, created_keys = _load_entries({(term, perspective) for _, term, perspective, _ in rows}, admin_user)
+    authors = _load_authors({fields["author"] for *_, fields in rows if fields["author"]})
+    latest_published = _latest_published_drafts({entry.pk for entry in entries.values()})
+
+    pending = []
+    for row_num, term, perspective, fields in rows:
+        key = (term.pk, perspective.pk)
+        entry = entries[key]
+        if key in created_keys:
+            created_keys.discard(key)
+            summary["entries_created"] += 1
+
+        published_draft = latest_published.get(entry.pk)
+        if published_draft and content_matches(published_draft.content, fields["content"]):
+            summary["skipped"] += 1
+            continue
+
+        if published_draft and published_draft.pk is None:
+            # The entry repeats within this batch; insert pending drafts so this one can reference it
+            _publish_drafts(pending, admin_user, staff_candidates)
+            pending = []
+
+        draft = EntryDraft(
+            entry=entry,
+            content=fields["content"],
+            author=authors.get(fields["author"], admin_user),
+            created_by=admin_user,
+            is_published=True,
+            published_at=timezone.now(),
+            replaces_draft=published_draft,
+        )
+        pending.append(draft)
+        latest_published[entry.pk] = draft
+        summary["drafts_created"] += 1
+
+    _publish_drafts(pending, admin_user, staff_candidates)
+
+    for row_num in sorted(errors):
+        _record_csv_error(summary, row_num, errors[row_num])
+
+
+def _process_csv_rows(reader, admin_user, summary):
+    """Process all CSV rows batch by batch and update summary."""
+    perspectives_cache = {}
+    # Fallback approvers for uploads where the admin and author alone fall short of MIN_APPROVALS
+    staff_candidates = list(
+        User.objects.filter(is_staff=True, is_active=True).exclude(id=admin_user.id).order_by("pk")[:2]
+    )
+
+    for batch in _iter_csv_batches(reader):
+        _process_csv_batch(batch, admin_user, summary, perspectives_cache, staff_candidates)
 
 
 def load_entries_from_csv(csv_file, admin_user, skip_duplicates=True):
@@ -211,12 +300,14 @@ def load_entries_from_csv(csv_file, admin_user, skip_duplicates=True):
 
     Returns:
         dict with summary: entries_created, drafts_created, skipped, errors
+        (the first MAX_REPORTED_CSV_ERRORS messages), errors_total
     """
     summary = {
         "entries_created": 0,
         "drafts_created": 0,
         "skipped": 0,
         "errors": [],
+        "errors_total": 0,
         "cross_references_resolved": 0,
     }
 
@@ -247,8 +338,6 @@ def resolve_cross_references():
     Returns:
         Number of cross-references resolved
     """
-    import re
-
     # Build lookup of all entries by (term_text, perspective_name)
     all_entries = {}
     for entry in Entry.objects.filter(is_deleted=False).select_related("term", "perspective"):
@@ -258,7 +347,7 @@ def resolve_cross_references():
     cross_ref_count = 0
 
     # Process all drafts that contain cross-reference placeholders
-    for draft in EntryDraft.objects.filter(is_deleted=False):
+    for draft in EntryDraft.objects.filter(is_deleted=False, content__contains="[["):
         content = draft.content
         if "[[" in content:
             # Find all cross-reference placeholders: [[Term|Perspective]]
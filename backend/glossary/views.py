@@ -308,7 +308,7 @@ class EntryViewSet(viewsets.ModelViewSet):
 
         published_draft.endorsed_by = request.user
         published_draft.endorsed_at = timezone.now()
-        published_draft.save()
+        published_draft.save(update_fields=["endorsed_by", "endorsed_at", "updated_at"])
 
         serializer = self.get_serializer(entry)
         return Response(serializer.data)
@@ -645,18 +645,10 @@ class EntryDraftViewSet(viewsets.ModelViewSet):
         if is_approved is not None:
             if is_approved.lower() == "true":
                 # Filter for approved drafts (approval_count >= MIN_APPROVALS)
-                from django.db.models import Count
-
-                queryset = queryset.annotate(approval_count_annotated=Count("approvers")).filter(
-                    approval_count_annotated__gte=settings.MIN_APPROVALS
-                )
+                queryset = queryset.filter(approval_count__gte=settings.MIN_APPROVALS)
             elif is_approved.lower() == "false":
                 # Filter for unapproved drafts (approval_count < MIN_APPROVALS)
-                from django.db.models import Count
-
-                queryset = queryset.annotate(approval_count_annotated=Count("approvers")).filter(
-                    approval_count_annotated__lt=settings.MIN_APPROVALS
-                )
+                queryset = queryset.filter(approval_count__lt=settings.MIN_APPROVALS)
 
         # Handle search parameter - only search terms
         search = self.request.query_params.get("search")
@@ -683,14 +675,14 @@ class EntryDraftViewSet(viewsets.ModelViewSet):
             and self.request.user.is_authenticated
             and not (eligibility == "requested_or_approved" and show_all)
         ):
-            from django.db.models import Count, Q
+            from django.db.models import Q
 
             if eligibility == "can_approve":
                 # Drafts the user can approve (not own, not already approved by them, not fully approved)
-                queryset = queryset.annotate(approval_count_annotated=Count("approvers")).filter(
+                queryset = queryset.filter(
                     ~Q(author=self.request.user),  # Not own drafts
                     ~Q(approvers=self.request.user),  # Not already approved by user
-                    approval_count_annotated__lt=settings.MIN_APPROVALS,  # Not approved yet
+                    approval_count__lt=settings.MIN_APPROVALS,  # Not approved yet
                 )
             elif eligibility == "requested_or_approved":
                 # Drafts the user was requested to review OR has already approved
@@ -732,7 +724,7 @@ class EntryDraftViewSet(viewsets.ModelViewSet):
         # Always exclude published drafts from review (they're not drafts anymore)
         # Also exclude drafts that come before the latest published draft for each entry
         # Only apply this filter for list actions, not for individual draft retrieval
-        # Composite index: EntryDraft(is_published, created_at) optimizes this common filter+order pattern
+        # Partial index gl_ed_archivable_created_idx covers this filter (with is_archived/is_deleted) and ordering
         if self.action == "list":
             queryset = queryset.filter(is_published=False)
 
@@ -1079,7 +1071,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             )
 
         comment.is_resolved = True
-        comment.save()
+        comment.save(update_fields=["is_resolved", "updated_at"])
 
         serializer = self.get_serializer(comment)
         return Response(serializer.data)
@@ -1102,7 +1094,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             )
 
         comment.is_resolved = False
-        comment.save()
+        comment.save(update_fields=["is_resolved", "updated_at"])
 
         serializer = self.get_serializer(comment)
         return Response(serializer.data)
@@ -1626,7 +1618,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
         # get_object() filters by user, so if notification doesn't exist or belongs to another user, it raises 404
         notification = self.get_object()
         notification.is_read = True
-        notification.save()
+        notification.save(update_fields=["is_read", "updated_at"])
         serializer = self.get_serializer(notification)
         return Response(serializer.data)
 